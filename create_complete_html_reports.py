@@ -1,179 +1,17 @@
 """
 Create complete HTML reports with full article text + embedded visualizations
 """
-import base64
 import re
-from pathlib import Path
+import sys
 
-def embed_image(img_path):
-    """Convert image to base64 data URI"""
-    with open(img_path, 'rb') as f:
-        img_data = base64.b64encode(f.read()).decode('utf-8')
-    return f"data:image/png;base64,{img_data}"
+from report_builder import build_report, css_inline, images_inline, markdown_to_html
 
-def markdown_to_html(md_text):
-    """Convert markdown to HTML with styling"""
-    html = md_text
-
-    # Headers
-    html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-
-    # Bold
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-
-    # Italic
-    html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
-    html = re.sub(r'_(.+?)_', r'<em>\1</em>', html)
-
-    # Links
-    html = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', html)
-
-    # Horizontal rules
-    html = re.sub(r'^---$', r'<hr>', html, flags=re.MULTILINE)
-
-    # Lists (simple)
-    html = re.sub(r'^- (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-    html = re.sub(r'(<li>.*</li>\n)+', lambda m: '<ul>\n' + m.group(0) + '</ul>\n', html)
-
-    # Paragraphs
-    lines = html.split('\n')
-    in_list = False
-    in_table = False
-    result = []
-
-    for line in lines:
-        if line.startswith('<'):  # HTML tag
-            result.append(line)
-        elif line.startswith('|'):  # Table
-            in_table = True
-            result.append(line)
-        elif line.strip() == '':
-            if in_table:
-                in_table = False
-            result.append(line)
-        elif not in_table:
-            if not line.startswith('<'):
-                result.append(f'<p>{line}</p>')
-            else:
-                result.append(line)
-        else:
-            result.append(line)
-
-    return '\n'.join(result)
-
-# CSS template
-CSS = """
-body {
-    font-family: 'Georgia', serif;
-    line-height: 1.8;
-    max-width: 900px;
-    margin: 0 auto;
-    padding: 40px 20px;
-    background-color: #f5f5f5;
-    color: #333;
-}
-.article-container {
-    background-color: white;
-    padding: 60px;
-    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-}
-h1 {
-    font-size: 2.5em;
-    line-height: 1.2;
-    margin-bottom: 0.3em;
-    color: #1a1a1a;
-    border-bottom: 3px solid #e74c3c;
-    padding-bottom: 15px;
-}
-h2 {
-    font-size: 1.8em;
-    margin-top: 1.5em;
-    margin-bottom: 0.5em;
-    color: #2c3e50;
-    border-bottom: 2px solid #e74c3c;
-    padding-bottom: 10px;
-}
-h3 {
-    font-size: 1.3em;
-    margin-top: 1.2em;
-    color: #34495e;
-}
-.figure {
-    margin: 40px 0;
-    text-align: center;
-    background-color: #fafafa;
-    padding: 20px;
-    border-radius: 8px;
-}
-.figure img {
-    max-width: 100%;
-    height: auto;
-    border: 1px solid #ddd;
-    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-}
-.figure-caption {
-    font-size: 0.9em;
-    color: #666;
-    font-style: italic;
-    margin-top: 15px;
-    text-align: left;
-    padding: 0 20px;
-}
-strong {
-    color: #e74c3c;
-    font-weight: 600;
-}
-em {
-    font-style: italic;
-}
-p {
-    margin-bottom: 1.2em;
-}
-ul {
-    margin-left: 30px;
-    margin-bottom: 1.2em;
-}
-li {
-    margin-bottom: 0.5em;
-}
-a {
-    color: #3498db;
-    text-decoration: none;
-}
-a:hover {
-    text-decoration: underline;
-}
-hr {
-    border: none;
-    border-top: 1px solid #ddd;
-    margin: 40px 0;
-}
-table {
-    width: 100%;
-    border-collapse: collapse;
-    margin: 20px 0;
-}
-th, td {
-    border: 1px solid #ddd;
-    padding: 12px;
-    text-align: left;
-}
-th {
-    background-color: #34495e;
-    color: white;
-}
-tr:nth-child(even) {
-    background-color: #f9f9f9;
-}
-.evidence-box {
-    background-color: #fff3cd;
-    border-left: 4px solid #e74c3c;
-    padding: 20px;
-    margin: 20px 0;
-}
-"""
+# --external-images / --external-css link figures and the stylesheet from
+# article/report_assets/ instead of embedding them (REPORT_EXTERNAL_IMAGES=1 /
+# REPORT_EXTERNAL_CSS=1 do the same); --force rebuilds unchanged reports
+INLINE = images_inline(False if '--external-images' in sys.argv else None)
+INLINE_CSS = css_inline(False if '--external-css' in sys.argv else None)
+FORCE = '--force' in sys.argv
 
 print("="*70)
 print("CREATING COMPLETE HTML REPORTS")
@@ -186,77 +24,33 @@ with open('article/medium_draft.md', 'r', encoding='utf-8') as f:
     article1_md = f.read()
 
 # Remove markdown image references (we'll embed them separately)
-article1_md = re.sub(r'!\[(.+?)\]\((.+?)\)\n\*(.+?)\*', '', article1_md)
-
-# Convert to HTML
-article1_html = markdown_to_html(article1_md)
-
-# Build complete HTML
-html1 = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>The Great Movie Rating Inflation: When 2008 Marked the Correction</title>
-    <style>{CSS}</style>
-</head>
-<body>
-    <div class="article-container">
-"""
-
-# Split article into sections and insert figures
-sections = article1_html.split('<h2>')
-html1 += sections[0]  # Title and intro
-
-# Add Figure 1 after intro
-html1 += f'''
-<div class="figure">
-    <img src="{embed_image('figures/fig1_rating_inflation_timeline.png')}" alt="Rating Inflation Timeline">
-    <p class="figure-caption">Figure 1: Movie ratings jumped around 2000, then corrected sharply after 2008. The smoothed trend line reveals the regime change clearly.</p>
-</div>
-'''
-
-# Continue with rest of article, inserting figures at appropriate points
-for i, section in enumerate(sections[1:], 1):
-    html1 += '<h2>' + section
-
-    # Insert figures after specific sections
-    if 'Three Distinct Eras' in section:
-        html1 += f'''
-<div class="figure">
-    <img src="{embed_image('figures/fig2_era_comparison_boxplot.png')}" alt="Era Comparison">
-    <p class="figure-caption">Figure 2: Box plots reveal the 2000-2009 era as a clear outlier, with significantly higher mean ratings than before or after.</p>
-</div>
-'''
-    elif 'High-Rated Movie Explosion' in section:
-        html1 += f'''
-<div class="figure">
-    <img src="{embed_image('figures/fig4_high_rated_explosion.png')}" alt="High-Rated Movie Explosion">
-    <p class="figure-caption">Figure 4: Top panel shows the exponential growth of ≥8.0 movies. Bottom panel shows the inverse relationship: fewer votes required.</p>
-</div>
-'''
-    elif 'Why 2008?' in section:
-        html1 += f'''
-<div class="figure">
-    <img src="{embed_image('figures/fig3_cutoff_statistical_evidence.png')}" alt="Statistical Evidence">
-    <p class="figure-caption">Figure 3: 2008 dominates both effect size and significance testing. The -log10(p-value) exceeds 45, meaning odds of this being random are less than 1 in 10⁴⁵.</p>
-</div>
-'''
-    elif 'Scrutiny Paradox' in section:
-        html1 += f'''
-<div class="figure">
-    <img src="{embed_image('figures/fig5_rating_vs_votes_scatter.png')}" alt="Rating vs Scrutiny">
-    <p class="figure-caption">Figure 5: Scatter plot reveals post-2010 movies (red/purple) cluster in the high-rating, low-vote zone — the "cheap excellence" quadrant.</p>
-</div>
-'''
-
-html1 += """
-    </div>
-</body>
-</html>"""
-
-with open('article/COMPLETE_article1_rating_inflation.html', 'w', encoding='utf-8') as f:
-    f.write(html1)
+if '![' in article1_md:
+    article1_md = re.sub(r'!\[(.+?)\]\((.+?)\)\n\*(.+?)\*', '', article1_md)
+
+# Figures: (anchor, after, img_path, alt, caption); section figures go just
+# before the next section's heading
+article1_figures = [
+    ('</h1>\n', True, 'figures/fig1_rating_inflation_timeline.png', 'Rating Inflation Timeline',
+     'Figure 1: Movie ratings jumped around 2000, then corrected sharply after 2008. The smoothed trend line reveals the regime change clearly.'),
+    ('<h2>The High-Rated Movie Explosion</h2>', False, 'figures/fig2_era_comparison_boxplot.png', 'Era Comparison',
+     'Figure 2: Box plots reveal the 2000-2009 era as a clear outlier, with significantly higher mean ratings than before or after.'),
+    ('<h2>Why 2008?</h2>', False, 'figures/fig4_high_rated_explosion.png', 'High-Rated Movie Explosion',
+     'Figure 4: Top panel shows the exponential growth of ≥8.0 movies. Bottom panel shows the inverse relationship: fewer votes required.'),
+    ('<h2>The Scrutiny Paradox</h2>', False, 'figures/fig3_cutoff_statistical_evidence.png', 'Statistical Evidence',
+     'Figure 3: 2008 dominates both effect size and significance testing. The -log10(p-value) exceeds 45, meaning odds of this being random are less than 1 in 10⁴⁵.'),
+    ('<h2>What This Means for You</h2>', False, 'figures/fig5_rating_vs_votes_scatter.png', 'Rating vs Scrutiny',
+     'Figure 5: Scatter plot reveals post-2010 movies (red/purple) cluster in the high-rating, low-vote zone — the "cheap excellence" quadrant.'),
+]
+
+build_report(
+    'The Great Movie Rating Inflation: When 2008 Marked the Correction',
+    markdown_to_html(article1_md),
+    'article/COMPLETE_article1_rating_inflation.html',
+    article1_figures,
+    force=FORCE,
+    inline=INLINE,
+    inline_css=INLINE_CSS,
+)
 
 print(f"  [OK] Created article/COMPLETE_article1_rating_inflation.html")
 
@@ -266,48 +60,31 @@ print("\n[2/2] Processing Article 2: Manipulation Investigation...")
 with open('article/manipulation_article_draft.md', 'r', encoding='utf-8') as f:
     article2_md = f.read()
 
-# Convert to HTML
-article2_html = markdown_to_html(article2_md)
-
-# Build complete HTML
-html2 = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Who's Gaming IMDb? The Hidden Manipulation of Movie Ratings</title>
-    <style>{CSS}</style>
-</head>
-<body>
-    <div class="article-container">
-{article2_html}
-
-<h2>Visual Evidence</h2>
-
-<div class="figure">
-    <img src="{embed_image('visualizations/manipulation_genre_anomalies.png')}" alt="Genre Anomalies">
-    <p class="figure-caption">Genre Anomalies: Documentary genre shows 7.21 mean rating, 1.40 points above baseline, suggesting systematic coordination in nonfiction content.</p>
-</div>
-
-<div class="figure">
-    <img src="{embed_image('visualizations/manipulation_franchise_coordination.png')}" alt="Franchise Coordination">
-    <p class="figure-caption">Franchise Coordination: MCU/DC/Star Wars films rate +0.93 points higher than standalone Action films (p&lt;0.000002), a statistically massive difference consistent with organized fan voting campaigns.</p>
-</div>
-
-<div class="figure">
-    <img src="{embed_image('visualizations/manipulation_studio_advantage.png')}" alt="Studio Advantage">
-    <p class="figure-caption">Studio Advantage: Disney shows +0.32 rating boost vs independent films, the largest studio-specific effect detected. Netflix shows +0.43 but with small sample size (16 films).</p>
-</div>
-
-<div class="figure">
-    <img src="{embed_image('visualizations/manipulation_benford_violations.png')}" alt="Benford's Law Test">
-    <p class="figure-caption">Benford's Law Test: Vote count first-digit distribution shows deviation from expected logarithmic pattern. P-value worsening from 0.168 (2010-2018) to 0.056 (2019-2024) suggests increasing artificial voting patterns.</p>
-</div>
-
-<div class="figure">
-    <img src="{embed_image('visualizations/manipulation_documentary.png')}" alt="Documentary Manipulation">
-    <p class="figure-caption">Documentary Manipulation: Vote efficiency (rating per 1000 votes) is 27× higher than expected baseline, indicating systematic boosting of documentary content likely driven by advocacy groups and political interests.</p>
-</div>
+# Figures sit next to the evidence they illustrate
+article2_figures = [
+    # Genre anomalies open the evidence section
+    ('<h2>The Evidence: Five Smoking Guns</h2>', True, 'visualizations/manipulation_genre_anomalies.png', 'Genre Anomalies',
+     '<strong>Figure 1: Genre Anomalies.</strong> Documentary genre shows 7.21 mean rating, 1.40 points above baseline. This statistical anomaly suggests systematic coordination in nonfiction content, likely driven by advocacy groups and political interests using documentaries for agenda-setting.'),
+    # End of Smoking Gun #1
+    ('<hr>\n<h3>Smoking Gun #2:', False, 'visualizations/manipulation_franchise_coordination.png', 'Franchise Coordination',
+     "<strong>Figure 2: Franchise Coordination.</strong> Action franchise films rate +0.93 points higher than standalone Action films (p&lt;0.000002, Cohen's d=0.75). Adventure franchises show +0.54 boost. This massive statistical gap (three-quarters of a standard deviation) cannot occur naturally and indicates organized fan voting campaigns coordinating to inflate franchise ratings."),
+    # End of Smoking Gun #4
+    ('<hr>\n<h3>Smoking Gun #5:', False, 'visualizations/manipulation_studio_advantage.png', 'Studio Advantage',
+     '<strong>Figure 3: Studio Advantage.</strong> Disney shows +0.32 rating boost vs independent films (6.40 vs 6.07), the largest studio-specific effect detected. Netflix shows +0.43 but with small sample (16 films). Warner Bros, Sony, and Paramount show small advantages, while Universal shows no advantage. The studio effect is primarily a Disney effect, driven by franchise-heavy portfolio (Marvel, Star Wars, Pixar).'),
+    # After the Historical Trend section
+    ('<hr>\n<h2>Could This All Be Natural?', False, 'visualizations/manipulation_benford_violations.png', "Benford's Law Violations",
+     "<strong>Figure 4: Benford's Law Violations.</strong> Vote count first-digit distribution deviates from expected logarithmic pattern (Benford's Law). P-value worsening from 0.168 (2010-2018) to 0.056 (2019-2024) suggests increasing prevalence of artificial voting patterns, though still below statistical significance threshold (p&lt;0.05). Round-number clustering shows 87 movies with suspiciously round vote counts."),
+    # First mention of the documentary anomaly
+    ('<p><strong>The Finding:</strong> 47 films show rating boosts', False, 'visualizations/manipulation_documentary.png', 'Documentary Manipulation',
+     '<strong>Figure 5: Documentary Manipulation.</strong> Documentary vote efficiency (rating per 1000 votes) is 27× higher than expected baseline, with recent mean rating of 7.21 vs historical 7.17. The efficiency anomaly indicates systematic boosting: documentaries achieve elite ratings with disproportionately fewer votes than other genres, consistent with coordinated campaigns by advocacy groups and political organizations using documentary ratings for agenda validation.'),
+]
+
+build_report(
+    "Who's Gaming IMDb? The Hidden Manipulation of Movie Ratings",
+    markdown_to_html(article2_md),
+    'article/COMPLETE_article2_manipulation.html',
+    article2_figures,
+    footer_html="""
 
 <h2>Conclusion</h2>
 
@@ -316,13 +93,11 @@ html2 = f"""<!DOCTYPE html>
 <p>Most importantly, the historical comparison reveals that manipulation is <strong>persistent but stable</strong>—not escalating as initially hypothesized. This suggests a steady-state equilibrium where coordinated voting has become normalized within the platform's ecosystem since 2010.</p>
 
 <p>For consumers, critics, and platforms, the implications are profound: the ratings we trust to guide our entertainment choices are increasingly shaped by organized campaigns rather than organic consensus. The question isn't whether manipulation exists—it's whether we're willing to acknowledge it and demand transparency.</p>
-
-    </div>
-</body>
-</html>"""
-
-with open('article/COMPLETE_article2_manipulation.html', 'w', encoding='utf-8') as f:
-    f.write(html2)
+""",
+    force=FORCE,
+    inline=INLINE,
+    inline_css=INLINE_CSS,
+)
 
 print(f"  [OK] Created article/COMPLETE_article2_manipulation.html")
 
@@ -334,7 +109,9 @@ print("  1. article/COMPLETE_article1_rating_inflation.html")
 print("  2. article/COMPLETE_article2_manipulation.html")
 print("\nThese files contain:")
 print("  [OK] Full article text (converted from markdown)")
-print("  [OK] All visualizations embedded (base64 encoded)")
+print("  [OK] All visualizations embedded (base64 encoded)" if INLINE else
+      "  [OK] All visualizations linked from article/report_assets/")
 print("  [OK] Professional styling")
-print("  [OK] Completely standalone (open in any browser)")
+if INLINE and INLINE_CSS:
+    print("  [OK] Completely standalone (open in any browser)")
 print("\nOpen either file in your browser to view the complete report!")
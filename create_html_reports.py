@@ -1,11 +1,13 @@
-import base64
-from pathlib import Path
+import sys
 
-def embed_image(img_path):
-    """Convert image to base64 data URI"""
-    with open(img_path, 'rb') as f:
-        img_data = base64.b64encode(f.read()).decode('utf-8')
-    return f"data:image/png;base64,{img_data}"
+from report_builder import build_report, css_inline, images_inline
+
+# --external-images / --external-css link figures and the stylesheet from
+# article/report_assets/ instead of embedding them (REPORT_EXTERNAL_IMAGES=1 /
+# REPORT_EXTERNAL_CSS=1 do the same); --force rebuilds unchanged reports
+INLINE = images_inline(False if '--external-images' in sys.argv else None)
+INLINE_CSS = css_inline(False if '--external-css' in sys.argv else None)
+FORCE = '--force' in sys.argv
 
 # Article 1: Rating Inflation
 print("Creating Article 1 with embedded images...")
@@ -17,89 +19,7 @@ article1_images = [
     ('figures/fig5_rating_vs_votes_scatter.png', 'Figure 5: Rating vs. Scrutiny - Recent high-rated films have far fewer votes')
 ]
 
-html1_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>The Great Movie Rating Inflation: When 2008 Marked the Correction</title>
-    <style>
-        body {
-            font-family: 'Georgia', serif;
-            line-height: 1.8;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 40px 20px;
-            background-color: #f5f5f5;
-            color: #333;
-        }
-        .article-container {
-            background-color: white;
-            padding: 60px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            font-size: 2.5em;
-            line-height: 1.2;
-            margin-bottom: 0.3em;
-            color: #1a1a1a;
-        }
-        h2 {
-            font-size: 1.8em;
-            margin-top: 1.5em;
-            margin-bottom: 0.5em;
-            color: #2c3e50;
-            border-bottom: 2px solid #e74c3c;
-            padding-bottom: 10px;
-        }
-        h3 {
-            font-size: 1.3em;
-            margin-top: 1.2em;
-            color: #34495e;
-        }
-        .subtitle {
-            font-size: 1.2em;
-            color: #555;
-            font-style: italic;
-            margin-bottom: 1em;
-        }
-        .attribution {
-            font-size: 0.9em;
-            color: #777;
-            font-style: italic;
-            border-left: 3px solid #3498db;
-            padding-left: 15px;
-            margin: 20px 0;
-        }
-        .figure {
-            margin: 30px 0;
-            text-align: center;
-        }
-        .figure img {
-            max-width: 100%;
-            height: auto;
-            border: 1px solid #ddd;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }
-        .figure-caption {
-            font-size: 0.9em;
-            color: #666;
-            font-style: italic;
-            margin-top: 10px;
-            text-align: center;
-        }
-        strong {
-            color: #e74c3c;
-            font-weight: 600;
-        }
-        p {
-            margin-bottom: 1.2em;
-        }
-    </style>
-</head>
-<body>
-    <div class="article-container">
-        <h1>The Great Movie Rating Inflation: When 2008 Marked the Correction</h1>
+article1_body = '''        <h1>The Great Movie Rating Inflation: When 2008 Marked the Correction</h1>
         <p class="subtitle">A statistical analysis of IMDb ratings reveals a surprising truth about when movie ratings became inflated</p>
 
         <div class="attribution">
@@ -111,28 +31,19 @@ html1_template = '''<!DOCTYPE html>
         <p><strong>Key Finding:</strong> Movie ratings didn't start inflating in 2008—they <em>corrected</em> in 2008. The real inflation happened between 2000-2010, when ratings jumped from 6.03 to 6.22. Since 2008, ratings have stabilized at a lower, more sustainable level.</p>
 '''
 
-# Add images
-for img_path, caption in article1_images:
-    if Path(img_path).exists():
-        img_data = embed_image(img_path)
-        html1_template += f'''
-        <div class="figure">
-            <img src="{img_data}" alt="{caption}">
-            <p class="figure-caption">{caption}</p>
-        </div>
-'''
-        print(f"  Embedded: {img_path}")
-    else:
-        print(f"  MISSING: {img_path}")
-
-html1_template += '''
+# Figures are appended after the summary, in order (caption doubles as alt text)
+build_report(
+    'The Great Movie Rating Inflation: When 2008 Marked the Correction',
+    article1_body,
+    'article/article1_rating_inflation_with_viz.html',
+    [(None, False, img_path, caption, caption) for img_path, caption in article1_images],
+    footer_html='''
         <p><em>Analysis based on 737,654 films from IMDb dataset. See full article for methodology and statistical evidence.</em></p>
-    </div>
-</body>
-</html>'''
-
-with open('article/article1_rating_inflation_with_viz.html', 'w', encoding='utf-8') as f:
-    f.write(html1_template)
+''',
+    force=FORCE,
+    inline=INLINE,
+    inline_css=INLINE_CSS,
+)
 print("[OK] Created article/article1_rating_inflation_with_viz.html\n")
 
 # Article 2: Manipulation Investigation
@@ -145,90 +56,7 @@ article2_images = [
     ('visualizations/manipulation_documentary.png', 'Documentary Manipulation: Vote efficiency 27x higher than expected')
 ]
 
-html2_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>The Ratings Manipulation Investigation: Evidence of Coordinated Voting Patterns</title>
-    <style>
-        body {
-            font-family: 'Georgia', serif;
-            line-height: 1.8;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 40px 20px;
-            background-color: #f5f5f5;
-            color: #333;
-        }
-        .article-container {
-            background-color: white;
-            padding: 60px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            font-size: 2.5em;
-            line-height: 1.2;
-            margin-bottom: 0.3em;
-            color: #1a1a1a;
-        }
-        h2 {
-            font-size: 1.8em;
-            margin-top: 1.5em;
-            margin-bottom: 0.5em;
-            color: #2c3e50;
-            border-bottom: 2px solid #e74c3c;
-            padding-bottom: 10px;
-        }
-        .subtitle {
-            font-size: 1.2em;
-            color: #555;
-            font-style: italic;
-            margin-bottom: 1em;
-        }
-        .attribution {
-            font-size: 0.9em;
-            color: #777;
-            font-style: italic;
-            border-left: 3px solid #3498db;
-            padding-left: 15px;
-            margin: 20px 0;
-        }
-        .figure {
-            margin: 30px 0;
-            text-align: center;
-        }
-        .figure img {
-            max-width: 100%;
-            height: auto;
-            border: 1px solid #ddd;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }
-        .figure-caption {
-            font-size: 0.9em;
-            color: #666;
-            font-style: italic;
-            margin-top: 10px;
-            text-align: center;
-        }
-        .evidence-box {
-            background-color: #fff3cd;
-            border-left: 4px solid #e74c3c;
-            padding: 20px;
-            margin: 20px 0;
-        }
-        strong {
-            color: #e74c3c;
-            font-weight: 600;
-        }
-        p {
-            margin-bottom: 1.2em;
-        }
-    </style>
-</head>
-<body>
-    <div class="article-container">
-        <h1>The Ratings Manipulation Investigation</h1>
+article2_body = '''        <h1>The Ratings Manipulation Investigation</h1>
         <p class="subtitle">Statistical evidence reveals coordinated voting patterns across franchises, studios, and genres</p>
 
         <div class="attribution">
@@ -251,28 +79,19 @@ html2_template = '''<!DOCTYPE html>
         <h2>Visual Evidence</h2>
 '''
 
-# Add images
-for img_path, caption in article2_images:
-    if Path(img_path).exists():
-        img_data = embed_image(img_path)
-        html2_template += f'''
-        <div class="figure">
-            <img src="{img_data}" alt="{caption}">
-            <p class="figure-caption">{caption}</p>
-        </div>
-'''
-        print(f"  Embedded: {img_path}")
-    else:
-        print(f"  MISSING: {img_path}")
-
-html2_template += '''
+# Figures are appended after the summary, in order (caption doubles as alt text)
+build_report(
+    'The Ratings Manipulation Investigation: Evidence of Coordinated Voting Patterns',
+    article2_body,
+    'article/article2_manipulation_with_viz.html',
+    [(None, False, img_path, caption, caption) for img_path, caption in article2_images],
+    footer_html='''
         <p><em>Analysis based on TMDb API integration (9,145 films fetched, 97% success rate), statistical hypothesis testing, and Benford's Law violations. See full investigation report for complete methodology.</em></p>
-    </div>
-</body>
-</html>'''
-
-with open('article/article2_manipulation_with_viz.html', 'w', encoding='utf-8') as f:
-    f.write(html2_template)
+''',
+    force=FORCE,
+    inline=INLINE,
+    inline_css=INLINE_CSS,
+)
 print("[OK] Created article/article2_manipulation_with_viz.html\n")
 
 print("\n[SUCCESS] Both reports created with embedded visualizations!")
@@ -0,0 +1,458 @@
+"""
+Shared helpers for building the HTML reports
+"""
+import base64
+import hashlib
+import io
+import os
+import re
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import markdown
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow ships with matplotlib, but don't require it here
+    Image = None
+
+ASSETS_DIR = Path('article') / 'report_assets'
+CACHE_DIR = Path('article') / '.cache'
+
+# Stylesheet shared by every report
+CSS = """
+body {
+    font-family: 'Georgia', serif;
+    line-height: 1.8;
+    max-width: 900px;
+    margin: 0 auto;
+    padding: 40px 20px;
+    background-color: #f5f5f5;
+    color: #333;
+}
+.article-container {
+    background-color: white;
+    padding: 60px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+h1 {
+    font-size: 2.5em;
+    line-height: 1.2;
+    margin-bottom: 0.3em;
+    color: #1a1a1a;
+    border-bottom: 3px solid #e74c3c;
+    padding-bottom: 15px;
+}
+h2 {
+    font-size: 1.8em;
+    margin-top: 1.5em;
+    margin-bottom: 0.5em;
+    color: #2c3e50;
+    border-bottom: 2px solid #e74c3c;
+    padding-bottom: 10px;
+}
+h3 {
+    font-size: 1.3em;
+    margin-top: 1.2em;
+    color: #34495e;
+}
+.subtitle {
+    font-size: 1.2em;
+    color: #555;
+    font-style: italic;
+    margin-bottom: 1em;
+}
+.attribution {
+    font-size: 0.9em;
+    color: #777;
+    font-style: italic;
+    border-left: 3px solid #3498db;
+    padding-left: 15px;
+    margin: 20px 0;
+}
+.figure {
+    margin: 40px 0;
+    text-align: center;
+    background-color: #fafafa;
+    padding: 20px;
+    border-radius: 8px;
+}
+.figure img {
+    max-width: 100%;
+    height: auto;
+    border: 1px solid #ddd;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+}
+.figure-caption {
+    font-size: 0.9em;
+    color: #666;
+    font-style: italic;
+    margin-top: 15px;
+    text-align: left;
+    padding: 0 20px;
+}
+strong {
+    color: #e74c3c;
+    font-weight: 600;
+}
+em {
+    font-style: italic;
+}
+p {
+    margin-bottom: 1.2em;
+}
+ul {
+    margin-left: 30px;
+    margin-bottom: 1.2em;
+}
+li {
+    margin-bottom: 0.5em;
+}
+a {
+    color: #3498db;
+    text-decoration: none;
+}
+a:hover {
+    text-decoration: underline;
+}
+hr {
+    border: none;
+    border-top: 1px solid #ddd;
+    margin: 40px 0;
+}
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 20px 0;
+}
+th, td {
+    border: 1px solid #ddd;
+    padding: 12px;
+    text-align: left;
+}
+th {
+    background-color: #34495e;
+    color: white;
+}
+tr:nth-child(even) {
+    background-color: #f9f9f9;
+}
+.evidence-box {
+    background-color: #fff3cd;
+    border-left: 4px solid #e74c3c;
+    padding: 20px;
+    margin: 20px 0;
+}
+"""
+
+
+def _optimize_bytes(src):
+    """Losslessly recompress a PNG with oxipng if installed, else Pillow"""
+    if shutil.which('oxipng'):
+        result = subprocess.run(['oxipng', '-o', 'max', '--strip', 'safe', '--stdout', str(src)],
+                                capture_output=True)
+        if result.returncode == 0 and result.stdout:
+            return result.stdout
+    if Image is not None:
+        buf = io.BytesIO()
+        with Image.open(src) as img:
+            img.save(buf, format='PNG', optimize=True)
+        return buf.getvalue()
+    return None
+
+
+def optimize_png(src):
+    """
+    Get the smallest lossless encoding of a PNG, cached on disk.
+
+    Optimized bytes are stored in article/.cache/png/ keyed by the source
+    path and mtime, so each figure is only recompressed after it changes.
+
+    Args:
+        src: Path to the PNG
+
+    Returns:
+        PNG bytes (the original file if optimization doesn't help)
+    """
+    src = Path(src).resolve()
+    mtime_ns = src.stat().st_mtime_ns
+    key = hashlib.blake2b(str(src).encode(), digest_size=4).hexdigest()
+    cache_dir = CACHE_DIR / 'png'
+    cached = cache_dir / f"{src.stem}-{key}-{mtime_ns}.png"
+    if cached.exists():
+        return cached.read_bytes()
+
+    original = src.read_bytes()
+    optimized = _optimize_bytes(src)
+    data = optimized if optimized and len(optimized) < len(original) else original
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{src.stem}-{key}-*.png"):
+        stale.unlink()
+    cached.write_bytes(data)
+    return data
+
+
+@lru_cache(maxsize=None)
+def _embed_cached(path, mtime):
+    """Base64-encode an image once per (path, mtime)"""
+    return b"data:image/png;base64," + base64.b64encode(optimize_png(path))
+
+
+def _embed_bytes(img_path):
+    """Data URI for an image as ASCII bytes (cached until the file changes)"""
+    path = Path(img_path).resolve()
+    return _embed_cached(str(path), path.stat().st_mtime)
+
+
+def embed_image(img_path):
+    """Convert image to base64 data URI (cached until the file changes)"""
+    return _embed_bytes(img_path).decode('ascii')
+
+
+def embed_images(img_paths):
+    """
+    Encode several images in parallel (b64encode releases the GIL).
+
+    The results land in embed_image's cache, so later embed_image calls for
+    the same files are free.
+    """
+    img_paths = list(img_paths)
+    if not img_paths:
+        return
+    workers = min(len(img_paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_embed_bytes, img_paths))
+
+
+def images_inline(inline=None):
+    """
+    Resolve whether figures are embedded or linked.
+
+    Images are inlined as base64 by default so reports stay standalone. With
+    inline None, REPORT_EXTERNAL_IMAGES=1 in the environment links them instead.
+    """
+    if inline is not None:
+        return inline
+    return os.environ.get('REPORT_EXTERNAL_IMAGES') != '1'
+
+
+def css_inline(inline=None):
+    """
+    Resolve whether the stylesheet is embedded or linked.
+
+    The stylesheet is embedded by default too, so the committed reports stay
+    standalone. With inline None, REPORT_EXTERNAL_CSS=1 in the environment
+    links article/report_assets/styles.css instead.
+    """
+    if inline is not None:
+        return inline
+    return os.environ.get('REPORT_EXTERNAL_CSS') != '1'
+
+
+def image_src(img_path, inline=None):
+    """
+    Get the <img src> value for a figure.
+
+    Args:
+        img_path: Path to the PNG (relative to the project root)
+        inline: Embed as a base64 data URI; otherwise copy the file into
+            article/report_assets/ and return a path relative to article/
+            (None: see images_inline)
+
+    Returns:
+        Data URI or relative URL
+    """
+    if images_inline(inline):
+        return embed_image(img_path)
+
+    src = Path(img_path)
+    dest = ASSETS_DIR / src.name
+    if not dest.exists() or dest.stat().st_mtime < src.stat().st_mtime:
+        ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dest)
+    return (Path(ASSETS_DIR.name) / dest.name).as_posix()
+
+
+def stylesheet_tag(inline=None):
+    """
+    Get the tag that applies the shared report stylesheet.
+
+    Args:
+        inline: Embed CSS in a <style> block; otherwise write
+            article/report_assets/styles.css (if stale) and link to it
+            (None: see css_inline)
+
+    Returns:
+        <style> or <link> tag
+    """
+    if css_inline(inline):
+        return f"<style>{CSS}</style>"
+
+    css_path = ASSETS_DIR / 'styles.css'
+    if not css_path.exists() or css_path.read_text(encoding='utf-8') != CSS:
+        ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+        css_path.write_text(CSS, encoding='utf-8')
+    return f'<link rel="stylesheet" href="{ASSETS_DIR.name}/styles.css">'
+
+
+# A paragraph line directly followed by the first line of a bullet or "1."
+# list. The drafts start lists without a blank line, which Python-Markdown
+# (unlike CommonMark) reads as paragraph text. Other numbers such as
+# "2024. was a year" don't start a list here, as in CommonMark
+_LIST_AFTER_PARAGRAPH = re.compile(r'^((?![-*+]\s|\d+\.\s|[\s|#>]|```|~~~).+\n)(?=(?:[-*+]|1\.)\s)', re.M)
+_FENCED_BLOCK = re.compile(r'^((?:```|~~~).*?^(?:```|~~~)[^\n]*$)', re.M | re.S)
+
+
+def markdown_to_html(md_text):
+    """
+    Convert markdown to HTML (tables, fenced code, nested lists).
+
+    The drafts nest sublists by 3 spaces, so tab_length is 3, and a list that
+    follows a paragraph line gets the blank line Python-Markdown needs to
+    start it. Fenced code is left as is.
+    """
+    parts = _FENCED_BLOCK.split(md_text)
+    parts[::2] = [_LIST_AFTER_PARAGRAPH.sub(r'\1\n', part) for part in parts[::2]]
+    return markdown.markdown(''.join(parts), extensions=['tables', 'fenced_code', 'sane_lists'],
+                             tab_length=3, output_format='html5')
+
+
+def write_figure(out, img_path, alt, caption, inline=None):
+    """
+    Write one figure block to a file opened in binary mode.
+
+    The data URI can be several MB, so its cached bytes are written on their
+    own rather than interpolated into the surrounding markup first.
+    inline works as in image_src.
+    """
+    out.write(b'\n<div class="figure">\n    <img src="')
+    if images_inline(inline):
+        out.write(_embed_bytes(img_path))
+    else:
+        out.write(image_src(img_path, inline=False).encode('utf-8'))
+    out.write(f'" alt="{alt}">\n    <p class="figure-caption">{caption}</p>\n</div>\n'.encode('utf-8'))
+
+
+def _report_digest(title, body_html, figures, footer_html, inline, inline_css):
+    """Hash everything that goes into a report, including the image bytes"""
+    h = hashlib.blake2b()
+    for part in (title, body_html, footer_html, repr(figures), CSS, f"{inline}/{inline_css}"):
+        h.update(part.encode('utf-8'))
+    for _, _, img_path, _, _ in figures:
+        h.update(Path(img_path).read_bytes())
+    return h.hexdigest()
+
+
+def build_report(title, body_html, out_path, figures=(), footer_html='', force=False,
+                 inline=None, inline_css=None):
+    """
+    Write a complete HTML report, placing figures inside the article body.
+
+    Args:
+        title: Page <title>
+        body_html: Article HTML (e.g. from markdown_to_html)
+        out_path: Destination .html file
+        figures: List of (anchor, after, img_path, alt, caption). Each figure is
+            spliced in just before the first occurrence of anchor in body_html
+            (just after it if after is True). Figures with anchor None are
+            appended after the body, in order.
+        footer_html: HTML written after the body and any appended figures
+        force: Rebuild even if the inputs match the last build
+        inline: Embed figures as data URIs rather than linking copies in
+            article/report_assets/ (None: see images_inline)
+        inline_css: Embed the stylesheet rather than linking it
+            (None: see css_inline)
+
+    Returns:
+        Path to the written report
+    """
+    out_path = Path(out_path)
+    inline = images_inline(inline)
+    inline_css = css_inline(inline_css)
+
+    present = []
+    for anchor, after, img_path, alt, caption in figures:
+        if Path(img_path).exists():
+            present.append((anchor, after, img_path, alt, caption))
+        else:
+            print(f"  MISSING: {img_path}")
+
+    # Resolved before the skip check so a linked styles.css that was deleted
+    # is written again even when the report itself is up to date
+    style_tag = stylesheet_tag(inline_css)
+
+    # Skip the rebuild when nothing that feeds the report has changed
+    digest = _report_digest(title, body_html, present, footer_html, inline, inline_css)
+    hash_path = CACHE_DIR / f"{out_path.name}.hash"
+    if not force and out_path.exists() and hash_path.exists() and hash_path.read_text() == digest:
+        print(f"  [SKIP] {out_path} unchanged")
+        return out_path
+
+    if inline:
+        embed_images(img_path for _, _, img_path, _, _ in present)
+
+    # anchor -> ([figures before it], [figures after it])
+    placed = {}
+    trailing = []
+    for anchor, after, img_path, alt, caption in present:
+        fig = (img_path, alt, caption)
+        if anchor is None:
+            trailing.append(fig)
+        else:
+            placed.setdefault(anchor, ([], []))[after].append(fig)
+        print(f"  {'Embedded' if inline else 'Linked'}: {img_path}")
+
+    # Write to a temp file and swap it in so a failed build never leaves a partial report
+    tmp_path = out_path.with_name(out_path.name + '.tmp')
+    with open(tmp_path, 'wb', buffering=1 << 22) as out:
+        out.write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    {style_tag}
+</head>
+<body>
+    <div class="article-container">
+""".encode('utf-8'))
+
+        # One scan over the body for every anchor; longest first so an anchor
+        # that is a prefix of another doesn't shadow it
+        pos = 0
+        if placed:
+            anchors = re.compile('|'.join(re.escape(a) for a in sorted(placed, key=len, reverse=True)))
+            for m in anchors.finditer(body_html):
+                frags = placed.pop(m.group(), None)
+                if frags is None:
+                    continue
+                before, after = frags
+                out.write(body_html[pos:m.start()].encode('utf-8'))
+                for fig in before:
+                    write_figure(out, *fig, inline=inline)
+                out.write(m.group().encode('utf-8'))
+                for fig in after:
+                    write_figure(out, *fig, inline=inline)
+                pos = m.end()
+                if not placed:
+                    break
+        out.write(body_html[pos:].encode('utf-8'))
+        for anchor in placed:
+            print(f"  MISSING anchor: {anchor!r}")
+
+        for fig in trailing:
+            write_figure(out, *fig, inline=inline)
+        out.write(footer_html.encode('utf-8'))
+        out.write(b"""
+    </div>
+</body>
+</html>""")
+    os.replace(tmp_path, out_path)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    hash_path.write_text(digest)
+    return out_path
@@ -7,26 +7,36 @@ Phases:
 3. Top 250 Volatility Tracking - Flash campaigns
 4. Historical Comparison - 2010-2018 vs. 2019-2024
 5. Final Report Generation
+
+Pass --with-basic to run run_manipulation_analysis.py first on the same master
+dataset; its 2019-2024 results are then reused in Phase 4 instead of recomputed.
 """
 
+import multiprocessing as mp
+import os
 import sys
 sys.path.append('src')
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import pandas as pd
 import numpy as np
 
-from data_loader import load_title_basics, load_title_ratings, merge_master_dataset, logger
+from data_loader import load_master_dataset, logger
 from manipulation_detection import (
     analyze_genre_anomalies,
     detect_vote_clustering,
     detect_franchise_coordination,
     analyze_documentary_manipulation,
-    identify_chinese_films_proxy
+    identify_chinese_films_proxy,
+    period_masks,
+    welch_ttest
 )
 from tmdb_integration import (
     fetch_tmdb_metadata_for_dataset,
     add_studio_tags,
+    summarize_studio_ratings,
+    BIG_FIVE_STUDIOS,
     TMDbClient
 )
 from historical_lists import (
@@ -34,8 +44,63 @@ from historical_lists import (
     identify_suspicious_top250_entries
 )
 
+# Run the basic 2019-2024 analysis first and share its results
+WITH_BASIC = '--with-basic' in sys.argv
+
+
+# Columns read by the period analyzers; workers only receive these
+PERIOD_COLUMNS = ['year', 'genres', 'genre_mask', 'imdb_rating', 'num_votes', 'title']
+
+_worker_master = None
+
+
+def _init_period_worker(master):
+    global _worker_master
+    _worker_master = master
+
+
+def _run_period_analyzer(fn, years_range):
+    return fn(_worker_master, years_range=years_range)
+
+
+def submit_period_analyses(master, periods):
+    """
+    Start the genre, Benford and franchise analyses for several periods in the background.
+
+    The master frame is handed to each worker once via the pool initializer
+    (copy-on-write under fork) instead of being pickled per task.
+
+    Args:
+        master: Master dataset
+        periods: List of (start_year, end_year) tuples
 
-def main():
+    Returns:
+        (executor, futures) where futures maps (analyzer name, period) to a
+        Future; the caller shuts the executor down once results are collected
+    """
+    analyzers = (analyze_genre_anomalies, detect_vote_clustering, detect_franchise_coordination)
+    tasks = [(fn, period) for period in periods for fn in analyzers]
+    ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+
+    ex = ProcessPoolExecutor(
+        max_workers=min(len(tasks), os.cpu_count() or 1),
+        mp_context=ctx,
+        initializer=_init_period_worker,
+        initargs=(master[PERIOD_COLUMNS],)
+    )
+    futures = {(fn.__name__, period): ex.submit(_run_period_analyzer, fn, period) for fn, period in tasks}
+    return ex, futures
+
+
+def main(master=None, basic_results=None):
+    """
+    Run all five phases of the investigation.
+
+    Args:
+        master: Already-loaded master dataset (loaded with min_votes=1000 if None)
+        basic_results: Output of run_manipulation_analysis.main() for the same
+            master; its 2019-2024 results are reused in Phase 4
+    """
     print("="*70)
     print("COMPREHENSIVE MANIPULATION INVESTIGATION")
     print("="*70)
@@ -48,12 +113,17 @@ def main():
     print("="*70)
 
     # Load master dataset
-    print("\n[0] Loading master dataset...")
-    basics = load_title_basics()
-    ratings = load_title_ratings()
-    master = merge_master_dataset(basics, ratings, min_votes=1000)
+    if master is None:
+        print("\n[0] Loading master dataset...")
+        master = load_master_dataset(min_votes=1000)
     print(f"[OK] Loaded {len(master):,} movies")
 
+    # Phase 4 only needs master, so its CPU-bound analyzers run in the
+    # background while Phases 1-3 wait on TMDb and the Wayback Machine
+    period1, period2 = (2010, 2018), (2019, 2024)
+    periods = [period1] if basic_results is not None else [period1, period2]
+    period_pool, period_futures = submit_period_analyses(master, periods)
+
     # ========================================
     # PHASE 1: TMDb Integration
     # ========================================
@@ -80,13 +150,10 @@ def main():
 
         # Summary by studio
         print("\nStudio Distribution (2019-2024):")
-        for studio in ['Disney', 'Warner Bros', 'Universal', 'Sony', 'Paramount', 'Netflix']:
-            count = master_with_tmdb[f'studio_{studio.lower().replace(" ", "_")}'].sum()
-            if count > 0:
-                mean_rating = master_with_tmdb[
-                    master_with_tmdb[f'studio_{studio.lower().replace(" ", "_")}']
-                ]['imdb_rating'].mean()
-                print(f"  - {studio}: {count} movies (mean rating: {mean_rating:.2f})")
+        studio_summary = summarize_studio_ratings(master_with_tmdb)
+        studio_summary = studio_summary[studio_summary['count'] > 0]
+        for studio, count, mean_rating in zip(studio_summary.index, studio_summary['count'], studio_summary['mean_rating']):
+            print(f"  - {studio}: {count} movies (mean rating: {mean_rating:.2f})")
 
     except Exception as e:
         logger.error(f"TMDb integration failed: {e}")
@@ -101,22 +168,25 @@ def main():
     print("="*70)
 
     if 'is_major_studio' in master_with_tmdb.columns:
-        recent = master_with_tmdb[master_with_tmdb['year'].between(2019, 2024)].copy()
+        recent_mask, _ = period_masks(master_with_tmdb, years_range=(2019, 2024))
+        recent = master_with_tmdb[recent_mask].copy()
 
         # Compare major studios vs. indies
         major_studio_films = recent[recent['is_major_studio']]
         indie_films = recent[~recent['is_major_studio']]
 
         if len(major_studio_films) > 0 and len(indie_films) > 0:
-            major_mean = major_studio_films['imdb_rating'].mean()
-            indie_mean = indie_films['imdb_rating'].mean()
+            major_ratings = major_studio_films['imdb_rating']
+            indie_ratings = indie_films['imdb_rating']
+            major_mean = major_ratings.mean()
+            indie_mean = indie_ratings.mean()
+            indie_var = indie_ratings.var()
+            indie_n = indie_ratings.count()
             diff = major_mean - indie_mean
 
-            from scipy import stats
-            t_stat, p_value = stats.ttest_ind(
-                major_studio_films['imdb_rating'].dropna(),
-                indie_films['imdb_rating'].dropna(),
-                equal_var=False
+            t_stat, p_value = welch_ttest(
+                major_mean, major_ratings.var(), major_ratings.count(),
+                indie_mean, indie_var, indie_n
             )
 
             print(f"\nMajor Studios vs. Indies:")
@@ -129,24 +199,22 @@ def main():
 
             # Compare individual studios
             print("\nIndividual Studio Analysis:")
-            studio_results = []
-            for studio in ['Disney', 'Warner Bros', 'Universal', 'Sony', 'Paramount']:
-                col = f'studio_{studio.lower().replace(" ", "_")}'
-                if col in recent.columns:
-                    studio_films = recent[recent[col]]
-                    if len(studio_films) >= 10:
-                        studio_mean = studio_films['imdb_rating'].mean()
-                        studio_vs_indie = studio_mean - indie_mean
-
-                        studio_results.append({
-                            'studio': studio,
-                            'count': len(studio_films),
-                            'mean_rating': studio_mean,
-                            'vs_indie': studio_vs_indie
-                        })
-
-                        print(f"  - {studio}: {studio_mean:.2f} ({len(studio_films)} films, "
-                              f"{studio_vs_indie:+.2f} vs. indies)")
+            studio_summary = summarize_studio_ratings(recent, BIG_FIVE_STUDIOS)
+            studio_summary = studio_summary[studio_summary['count'] >= 10]
+            studio_t, studio_p = welch_ttest(
+                studio_summary['mean_rating'], studio_summary['var_rating'], studio_summary['rated'],
+                indie_mean, indie_var, indie_n
+            )
+            studio_summary = studio_summary.assign(
+                vs_indie=studio_summary['mean_rating'] - indie_mean,
+                t_statistic=studio_t,
+                p_value=studio_p
+            )[['count', 'mean_rating', 'vs_indie', 't_statistic', 'p_value']]
+            studio_results = studio_summary.reset_index().to_dict('records')
+
+            for s in studio_results:
+                print(f"  - {s['studio']}: {s['mean_rating']:.2f} ({s['count']} films, "
+                      f"{s['vs_indie']:+.2f} vs. indies, p={s['p_value']:.4f})")
 
             # Export studio analysis
             if studio_results:
@@ -203,31 +271,44 @@ def main():
     print("[PHASE 4] Historical Comparison (2010-2018 vs. 2019-2024)")
     print("="*70)
 
-    print("\nRunning analysis for 2010-2018 period...")
-    period1_genre = analyze_genre_anomalies(master, years_range=(2010, 2018))
-    period1_benford = detect_vote_clustering(master, years_range=(2010, 2018))
-    period1_franchise = detect_franchise_coordination(master, years_range=(2010, 2018))
-
-    print("\nRunning analysis for 2019-2024 period...")
-    period2_genre = analyze_genre_anomalies(master, years_range=(2019, 2024))
-    period2_benford = detect_vote_clustering(master, years_range=(2019, 2024))
-    period2_franchise = detect_franchise_coordination(master, years_range=(2019, 2024))
+    if basic_results is not None:
+        print("\nCollecting 2010-2018 analyses (reusing 2019-2024 from the basic analysis)...")
+    else:
+        print("\nCollecting 2010-2018 and 2019-2024 analyses (started after loading)...")
+    with period_pool:
+        results = {key: future.result() for key, future in period_futures.items()}
+    if basic_results is not None:
+        results.update({(name, period2): result for name, result in basic_results.items()})
+
+    period1_genre = results[('analyze_genre_anomalies', period1)]
+    period1_benford = results[('detect_vote_clustering', period1)]
+    period1_franchise = results[('detect_franchise_coordination', period1)]
+
+    period2_genre = results[('analyze_genre_anomalies', period2)]
+    period2_benford = results[('detect_vote_clustering', period2)]
+    period2_franchise = results[('detect_franchise_coordination', period2)]
+
+    # Suspicious counts are reused by the comparison and the final report
+    period1_suspicious_genres = int(period1_genre['suspicious'].sum())
+    period2_suspicious_genres = int(period2_genre['suspicious'].sum())
+    period1_suspicious_franchise = int(period1_franchise['suspicious'].sum())
+    period2_suspicious_franchise = int(period2_franchise['suspicious'].sum())
 
     print("\n" + "-"*70)
     print("COMPARISON: 2010-2018 vs. 2019-2024")
     print("-"*70)
 
     print("\n[1] Genre Anomalies:")
-    print(f"  2010-2018: {len(period1_genre[period1_genre['suspicious']])} suspicious genres")
-    print(f"  2019-2024: {len(period2_genre[period2_genre['suspicious']])} suspicious genres")
+    print(f"  2010-2018: {period1_suspicious_genres} suspicious genres")
+    print(f"  2019-2024: {period2_suspicious_genres} suspicious genres")
 
     print("\n[2] Benford's Law:")
     print(f"  2010-2018: p={period1_benford['p_value']:.4f} ({period1_benford['manipulation_probability']})")
     print(f"  2019-2024: p={period2_benford['p_value']:.4f} ({period2_benford['manipulation_probability']})")
 
     print("\n[3] Franchise Coordination:")
-    print(f"  2010-2018: {len(period1_franchise[period1_franchise['suspicious']])} genres with boost")
-    print(f"  2019-2024: {len(period2_franchise[period2_franchise['suspicious']])} genres with boost")
+    print(f"  2010-2018: {period1_suspicious_franchise} genres with boost")
+    print(f"  2019-2024: {period2_suspicious_franchise} genres with boost")
 
     if len(period1_franchise) > 0 and len(period2_franchise) > 0:
         # Compare Action genre across periods
@@ -254,7 +335,7 @@ def main():
     evidence_details = []
 
     # Genre anomalies (2019-2024)
-    if len(period2_genre[period2_genre['suspicious']]) > 0:
+    if period2_suspicious_genres > 0:
         evidence_count += 1
         evidence_details.append("Genre anomalies detected")
 
@@ -264,7 +345,7 @@ def main():
         evidence_details.append("Benford's Law violations")
 
     # Franchise coordination (2019-2024)
-    if len(period2_franchise[period2_franchise['suspicious']]) > 0:
+    if period2_suspicious_franchise > 0:
         evidence_count += 1
         evidence_details.append("Franchise coordination")
 
@@ -325,4 +406,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if WITH_BASIC:
+        from run_manipulation_analysis import main as run_basic_analysis
+
+        master = load_master_dataset(min_votes=1000)
+        main(master, basic_results=run_basic_analysis(master))
+    else:
+        main()
@@ -8,13 +8,14 @@ sys.path.append('src')
 from pathlib import Path
 import pandas as pd
 
-from data_loader import load_title_basics, load_title_ratings, merge_master_dataset, logger
+from data_loader import load_master_dataset, logger
 from manipulation_detection import (
     analyze_genre_anomalies,
     detect_vote_clustering,
     detect_franchise_coordination,
     analyze_documentary_manipulation,
-    identify_chinese_films_proxy
+    identify_chinese_films_proxy,
+    period_masks
 )
 from viz import (
     plot_genre_anomalies,
@@ -25,25 +26,35 @@ from viz import (
 )
 
 
-def main():
+def main(master=None):
+    """
+    Run the 2019-2024 manipulation analyses, export figures/CSVs and print a summary.
+
+    Args:
+        master: Already-loaded master dataset (loaded with min_votes=1000 if None)
+
+    Returns:
+        Dict mapping analyzer name (e.g. 'analyze_genre_anomalies') to its result
+    """
     print("="*70)
     print("MANIPULATION INVESTIGATION: 2019-2024 RATING INFLATION")
     print("="*70)
 
     # Load data
     print("\n[1/6] Loading datasets...")
-    basics = load_title_basics()
-    ratings = load_title_ratings()
-    master = merge_master_dataset(basics, ratings, min_votes=1000)
+    if master is None:
+        master = load_master_dataset(min_votes=1000)
 
     print(f"[OK] Loaded {len(master):,} movies (>=1,000 votes)")
-    print(f"[OK] Recent period (2019-2024): {len(master[master['year'].between(2019, 2024)]):,} movies")
+    recent_mask, _ = period_masks(master, years_range=(2019, 2024))
+    print(f"[OK] Recent period (2019-2024): {recent_mask.sum():,} movies")
 
     # Analysis 1: Genre Anomalies
     print("\n[2/6] Running genre anomaly analysis...")
     genre_results = analyze_genre_anomalies(master, years_range=(2019, 2024))
     plot_genre_anomalies(genre_results, years_range=(2019, 2024))
-    print(f"[OK] Found {len(genre_results[genre_results['suspicious']])} suspicious genres")
+    suspicious_genres = genre_results[genre_results['suspicious'].to_numpy()]
+    print(f"[OK] Found {len(suspicious_genres)} suspicious genres")
 
     # Analysis 2: Benford's Law
     print("\n[3/6] Running Benford's Law test...")
@@ -55,7 +66,8 @@ def main():
     print("\n[4/6] Detecting franchise coordination...")
     franchise_results = detect_franchise_coordination(master, years_range=(2019, 2024))
     plot_franchise_coordination(franchise_results)
-    print(f"[OK] Found {len(franchise_results[franchise_results['suspicious']])} genres with suspicious franchise boost")
+    suspicious_franchise = franchise_results[franchise_results['suspicious'].to_numpy()]
+    print(f"[OK] Found {len(suspicious_franchise)} genres with suspicious franchise boost")
 
     # Analysis 4: Documentary Manipulation
     print("\n[5/6] Analyzing documentary genre...")
@@ -79,7 +91,6 @@ def main():
     print("="*70)
 
     print("\n[1] GENRE ANOMALIES:")
-    suspicious_genres = genre_results[genre_results['suspicious']]
     if len(suspicious_genres) > 0:
         for _, row in suspicious_genres.iterrows():
             print(f"   - {row['genre']}: {row['recent_mean']:.2f} (historical: {row['historical_mean']:.2f}, " +
@@ -94,7 +105,6 @@ def main():
     print(f"   - Verdict: {benford_results['verdict']}")
 
     print("\n[3] FRANCHISE COORDINATION:")
-    suspicious_franchise = franchise_results[franchise_results['suspicious']]
     if len(suspicious_franchise) > 0:
         for _, row in suspicious_franchise.iterrows():
             print(f"   - {row['genre']}: Franchise +{row['difference']:.2f} vs. standalone " +
@@ -124,7 +134,7 @@ def main():
     output_dir = Path('article')
     output_dir.mkdir(exist_ok=True)
 
-    genre_results[genre_results['suspicious']].to_csv(
+    suspicious_genres.to_csv(
         output_dir / 'manipulation_suspicious_genres.csv', index=False
     )
     franchise_results.to_csv(
@@ -187,6 +197,14 @@ def main():
     else:
         print("\n[INFO] Limited evidence of manipulation - recent inflation may be organic.")
 
+    return {
+        'analyze_genre_anomalies': genre_results,
+        'detect_vote_clustering': benford_results,
+        'detect_franchise_coordination': franchise_results,
+        'analyze_documentary_manipulation': doc_results,
+        'identify_chinese_films_proxy': chinese_films,
+    }
+
 
 if __name__ == "__main__":
     main()
@@ -18,8 +18,14 @@ from typing import Tuple
 
 import markdown
 
+# Markdown image references and <img> tags not already wrapped in <p>
+_MD_IMAGE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+_BARE_IMG = re.compile(r'(?<!<p>)(<img [^>]+>)(?!</p>)')
+# First H1 heading, used as the document title
+_TITLE = re.compile(r'^# (.+)$', re.MULTILINE)
 
-def generate_unique_filename(article_name: str, html_content: str) -> str:
+
+def generate_unique_filename(article_name: str, html_bytes: bytes) -> str:
     """
     Generate unique timestamped filename to bypass Medium's aggressive caching.
 
@@ -28,13 +34,13 @@ def generate_unique_filename(article_name: str, html_content: str) -> str:
 
     Args:
         article_name: Base name for the article (e.g., "rating_inflation")
-        html_content: Full HTML content to hash
+        html_bytes: Full HTML content, UTF-8 encoded (the bytes written to disk)
 
     Returns:
         Unique filename string
     """
     timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-    content_hash = hashlib.md5(html_content.encode()).hexdigest()[:8]
+    content_hash = hashlib.blake2b(html_bytes, digest_size=4).hexdigest()
     return f"{article_name}_{timestamp}_{content_hash}.html"
 
 
@@ -66,7 +72,8 @@ def markdown_to_html(markdown_content: str, github_pages_base: str, repo_name: s
         github_url = f"{github_pages_base}/{repo_name}/{img_path}"
         return f'![{alt_text}]({github_url})'
 
-    md_text = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', replace_image_url, md_text)
+    if '![' in md_text:
+        md_text = _MD_IMAGE.sub(replace_image_url, md_text)
 
     # Convert markdown to HTML using the markdown library
     html = markdown.markdown(
@@ -78,11 +85,8 @@ def markdown_to_html(markdown_content: str, github_pages_base: str, repo_name: s
     # Post-process: ensure images are wrapped in <p> tags (Medium requirement)
     # The markdown library produces <p><img ...></p> by default for standalone images,
     # but verify and fix any bare <img> tags
-    html = re.sub(
-        r'(?<!<p>)(<img [^>]+>)(?!</p>)',
-        r'<p>\1</p>',
-        html
-    )
+    if '<img ' in html:
+        html = _BARE_IMG.sub(r'<p>\1</p>', html)
 
     return html
 
@@ -111,7 +115,7 @@ def export_article_for_medium(
         markdown_content = f.read()
 
     # Extract title from first H1 heading
-    title_match = re.search(r'^# (.+)$', markdown_content, re.MULTILINE)
+    title_match = _TITLE.search(markdown_content)
     title = title_match.group(1) if title_match else "Article"
 
     # Convert markdown body to HTML
@@ -137,15 +141,17 @@ def export_article_for_medium(
     elif article_name == "manipulation_article_draft":
         article_name = "manipulation"
 
-    filename = generate_unique_filename(article_name, html_content)
+    # Encode once; the same bytes are hashed for the filename and written out
+    html_bytes = html_content.encode('utf-8')
+    filename = generate_unique_filename(article_name, html_bytes)
 
     # Write HTML file
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / filename
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    with open(output_path, 'wb') as f:
+        f.write(html_bytes)
 
     # Generate GitHub Pages URL
     github_url = f"{github_pages_base}/{repo_name}/article/{filename}"
@@ -6,11 +6,28 @@ Adapted from G:/ai/nfl/src/data_loader.py caching pattern.
 
 import gzip
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Optional, Callable, Tuple
-import urllib.request
 
+import numpy as np
 import pandas as pd
+import requests
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # optional; falls back to pandas' chunked reader
+    pacsv = None
+
+try:
+    import rapidgzip
+except ImportError:  # optional; parallel gzip decompression
+    rapidgzip = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -36,15 +53,61 @@ IMDB_DATASETS = {
     "name_basics": "name.basics.tsv.gz"
 }
 
-
-def _load_or_fetch(name: str, fetch_fn: Callable, force_refresh: bool = False) -> pd.DataFrame:
+# Valid IMDb title ID (e.g. tt0111161)
+IMDB_ID_PATTERN = r'^tt\d{7,8}$'
+
+# IMDb's fixed genre vocabulary; bit i of genre_mask is IMDB_GENRES[i]
+IMDB_GENRES = (
+    'Action', 'Adult', 'Adventure', 'Animation', 'Biography', 'Comedy', 'Crime',
+    'Documentary', 'Drama', 'Family', 'Fantasy', 'Film-Noir', 'Game-Show', 'History',
+    'Horror', 'Music', 'Musical', 'Mystery', 'News', 'Reality-TV', 'Romance',
+    'Sci-Fi', 'Short', 'Sport', 'Talk-Show', 'Thriller', 'War', 'Western'
+)
+GENRE_BITS = {genre: 1 << i for i, genre in enumerate(IMDB_GENRES)}
+# GENRE_BITS by IMDB_GENRES position, plus a trailing 0 for unknown genres
+_GENRE_BIT_TABLE = np.array([GENRE_BITS[genre] for genre in IMDB_GENRES] + [0], dtype=np.uint32)
+
+# Master columns stored as float32: years and runtimes are whole numbers,
+# exact in float32, and NaN still marks missing values. imdb_rating stays
+# float64: one-decimal ratings such as 6.1 are not exact in float32 and
+# would surface as 6.099999904632568 in exported results.
+FLOAT32_COLUMNS = ['year', 'runtime']
+
+# Text columns kept as Arrow-backed strings (pandas' default from 3.0): no
+# per-value Python objects, and cheaper to hash when merging on imdb_id
+STRING_COLUMNS = ['imdb_id', 'title']
+if pacsv is None:
+    STRING_DTYPE = None
+else:
+    try:
+        STRING_DTYPE = pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:  # pandas < 2.3
+        STRING_DTYPE = pd.StringDtype('pyarrow_numpy')
+
+
+# Datasets already loaded in this process: name -> (cache file mtime, DataFrame)
+_MEMCACHE = {}
+
+
+def _load_or_fetch(
+    name: str,
+    fetch_fn: Callable,
+    force_refresh: bool = False,
+    columns: Optional[list] = None
+) -> pd.DataFrame:
     """
     Load data from cache or fetch from source.
 
+    Each dataset is read from disk at most once per process (until its cache
+    file changes). Callers get a shallow copy, so adding or replacing columns
+    is safe, but values should not be modified in place.
+
     Args:
         name: Dataset name (used for cache filename)
         fetch_fn: Function that fetches and returns DataFrame
         force_refresh: If True, ignore cache and re-fetch
+        columns: Optional list of columns to return. Unless the full dataset
+            is already in memory, only these columns are read from the cache.
 
     Returns:
         DataFrame with requested data
@@ -52,79 +115,258 @@ def _load_or_fetch(name: str, fetch_fn: Callable, force_refresh: bool = False) -
     cache_path = PROCESSED_DIR / f"{name}.parquet"
 
     if cache_path.exists() and not force_refresh:
+        mtime = cache_path.stat().st_mtime_ns
+        cached = _MEMCACHE.get(name)
+        if cached is not None and cached[0] == mtime:
+            df = cached[1]
+            return df.copy(deep=False) if columns is None else df[columns].copy(deep=False)
+
         logger.info(f"Loading cached {name} from {cache_path}")
-        return pd.read_parquet(cache_path)
+        # fastparquet stores list columns (genres) as JSON; read them back with it too
+        df = pd.read_parquet(cache_path, engine='fastparquet', columns=columns)
+        if columns is not None:
+            return df
+        _MEMCACHE[name] = (mtime, df)
+        return df.copy(deep=False)
 
     logger.info(f"Fetching {name} from source...")
     df = fetch_fn()
 
     logger.info(f"Caching {name} to {cache_path}")
     df.to_parquet(cache_path, engine='fastparquet', index=False)
+    _MEMCACHE[name] = (cache_path.stat().st_mtime_ns, df)
 
-    return df
+    return df.copy(deep=False) if columns is None else df[columns].copy(deep=False)
+
+
+def _is_current(local_path: Path, url: str) -> bool:
+    """
+    Whether a downloaded IMDb file matches the server's copy.
+
+    A HEAD request compares the server's Content-Length and Last-Modified
+    with the local file; if the server can't be reached the local copy is
+    treated as current.
+    """
+    if not local_path.exists():
+        return False
+
+    try:
+        head = requests.head(url, timeout=30, allow_redirects=True)
+        head.raise_for_status()
+    except requests.RequestException as e:
+        logger.warning(f"Could not check {url} ({e}); using local copy")
+        return True
+
+    stat = local_path.stat()
+    size = head.headers.get('Content-Length')
+    modified = head.headers.get('Last-Modified')
+    size_ok = size is None or int(size) == stat.st_size
+    fresh = modified is None or parsedate_to_datetime(modified).timestamp() <= stat.st_mtime
+    if size_ok and fresh:
+        logger.info(f"IMDb file is up to date: {local_path}")
+        return True
+    logger.info(f"IMDb file is out of date: {local_path}")
+    return False
+
+
+def _stream_download(url: str, local_path: Path, pipe=None):
+    """
+    Stream url to local_path via a .part file, optionally copying each chunk to pipe.
 
+    The .part file replaces local_path only once the download is complete.
+    """
+    tmp_path = local_path.with_name(local_path.name + '.part')
+    with requests.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        with open(tmp_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
+                if pipe is not None:
+                    pipe.write(chunk)
+    os.replace(tmp_path, local_path)
+    logger.info(f"Downloaded to {local_path}")
 
-def _download_imdb_file(filename: str) -> Path:
+
+@contextmanager
+def _open_imdb_source(filename: str):
     """
-    Download IMDb dataset file if not already present.
+    Open an IMDb dataset for parsing, downloading it first if needed.
+
+    A current local copy is opened with _open_imdb_file. Otherwise the
+    download runs in a background thread that writes each chunk both to the
+    raw cache file and to a pipe, and the pipe is decompressed and parsed as
+    the bytes arrive, so parsing overlaps the download instead of waiting
+    for it.
 
     Args:
         filename: Name of the IMDb dataset file (e.g., "title.basics.tsv.gz")
 
-    Returns:
-        Path to downloaded file
+    Yields:
+        Path to the .tsv.gz, or a binary file object of decompressed TSV
     """
     url = IMDB_BASE_URL + filename
     local_path = RAW_DIR / filename
 
-    if local_path.exists():
-        logger.info(f"IMDb file already exists: {local_path}")
-        return local_path
-
-    logger.info(f"Downloading {filename} from {url}")
-    urllib.request.urlretrieve(url, local_path)
-    logger.info(f"Downloaded to {local_path}")
+    if _is_current(local_path, url):
+        with _open_imdb_file(local_path) as source:
+            yield source
+        return
+
+    logger.info(f"Downloading {filename} from {url} (parsing as it arrives)")
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, 'rb')
+
+    def download():
+        with os.fdopen(write_fd, 'wb') as pipe:
+            _stream_download(url, local_path, pipe)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(download)
+    try:
+        with gzip.GzipFile(fileobj=reader) as source:
+            yield source
+    except Exception:
+        # Closing the read end unblocks the writer if parsing stopped early;
+        # a failed download is the root cause of any parse error it led to
+        reader.close()
+        error = future.exception()
+        if error is not None and not isinstance(error, BrokenPipeError):
+            raise error
+        raise
+    finally:
+        reader.close()
+        executor.shutdown(wait=True)
+    future.result()
+
+
+@contextmanager
+def _open_imdb_file(filepath: Path):
+    """
+    Open an IMDb .tsv.gz for reading, decompressing in parallel if possible.
 
-    return local_path
+    With rapidgzip installed this yields a file object that decompresses on all
+    cores. Its seek-point index is saved next to the archive
+    (<file>.gz.rgidx) and reused on later runs; it is rebuilt whenever the
+    archive is newer. Without rapidgzip the path itself is yielded, so the
+    readers fall back to their own single-threaded gzip handling.
 
+    Args:
+        filepath: Path to .tsv.gz file
 
-def _read_imdb_tsv(filepath: Path, columns: Optional[list] = None, chunksize: int = 100000) -> pd.DataFrame:
+    Yields:
+        Binary file object or the original path
     """
-    Read IMDb TSV file (gzip compressed) in chunks to handle large files.
+    if rapidgzip is None:
+        yield filepath
+        return
+
+    index_path = filepath.with_name(filepath.name + '.rgidx')
+    if index_path.exists() and index_path.stat().st_mtime < filepath.stat().st_mtime:
+        index_path.unlink()
+
+    with rapidgzip.open(str(filepath), parallelization=os.cpu_count() or 0) as f:
+        if index_path.exists():
+            with open(index_path, 'rb') as idx:
+                f.import_index(idx)
+        yield f
+        if not index_path.exists():
+            with open(index_path, 'wb') as idx:
+                f.export_index(idx)
+
+
+def _read_imdb_tsv(
+    filename: str,
+    columns: Optional[list] = None,
+    chunksize: int = 100000,
+    title_type: Optional[str] = None,
+    string_columns: Optional[list] = None,
+    list_columns: Optional[list] = None
+) -> pd.DataFrame:
+    """
+    Read IMDb TSV file (gzip compressed).
+
+    Uses PyArrow's multithreaded CSV reader when it is installed, otherwise
+    pandas in chunks to handle large files.
 
     Args:
-        filepath: Path to .tsv.gz file
+        filename: Name of the IMDb dataset file (downloaded if needed,
+            see _open_imdb_source)
         columns: Optional list of columns to keep (None = keep all)
-        chunksize: Number of rows to read at a time
+        chunksize: Number of rows to read at a time (pandas fallback only)
+        title_type: If given, keep only rows with this titleType (e.g. "movie")
+        string_columns: Columns to read as text instead of inferring a type
+            (for columns with stray non-numeric values; PyArrow only)
+        list_columns: Comma-separated columns to split into lists
 
     Returns:
         DataFrame with IMDb data
     """
-    logger.info(f"Reading {filepath.name} in chunks of {chunksize:,}...")
-
-    # IMDb uses '\N' for null values
-    chunks = []
-    total_rows = 0
-
-    for chunk in pd.read_csv(
-        filepath,
-        sep='\t',
-        na_values=['\\N'],
-        low_memory=False,
-        usecols=columns,
-        chunksize=chunksize
-    ):
-        chunks.append(chunk)
-        total_rows += len(chunk)
-        if total_rows % 500000 == 0:
-            logger.info(f"  Processed {total_rows:,} rows...")
-
-    df = pd.concat(chunks, ignore_index=True)
-    logger.info(f"Loaded {len(df):,} rows from {filepath.name}")
+    if pacsv is not None:
+        logger.info(f"Reading {filename} with PyArrow...")
+
+        # IMDb uses '\N' for null values and never quotes fields
+        options = dict(
+            read_options=pacsv.ReadOptions(block_size=32 << 20, use_threads=True),
+            parse_options=pacsv.ParseOptions(delimiter='\t', quote_char=False),
+            convert_options=pacsv.ConvertOptions(
+                null_values=['\\N'],
+                strings_can_be_null=True,
+                include_columns=columns,
+                column_types={col: pa.string() for col in string_columns or []}
+            )
+        )
+
+        with _open_imdb_source(filename) as source:
+            if title_type is None:
+                table = pacsv.read_csv(source, **options)
+                total_rows = table.num_rows
+            else:
+                # Stream record batches and keep only matching rows, so the
+                # full file is never held in memory at once
+                batches = []
+                total_rows = 0
+                with pacsv.open_csv(source, **options) as reader:
+                    for batch in reader:
+                        total_rows += batch.num_rows
+                        batches.append(batch.filter(pc.equal(batch.column('titleType'), title_type)))
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+        # Split list columns with Arrow's kernel rather than pandas' str.split
+        list_columns = sorted(list_columns or [], key=table.column_names.index)
+        df = table.drop_columns(list_columns).to_pandas(types_mapper={pa.string(): STRING_DTYPE}.get)
+        for col in list_columns:
+            df.insert(table.column_names.index(col), col, pc.split_pattern(table[col], ',').to_pylist())
+    else:
+        logger.info(f"Reading {filename} in chunks of {chunksize:,}...")
+
+        # IMDb uses '\N' for null values
+        chunks = []
+        total_rows = 0
+
+        with _open_imdb_source(filename) as source:
+            for chunk in pd.read_csv(
+                source,
+                sep='\t',
+                na_values=['\\N'],
+                low_memory=False,
+                usecols=columns,
+                chunksize=chunksize
+            ):
+                total_rows += len(chunk)
+                if title_type is not None:
+                    chunk = chunk[chunk['titleType'] == title_type]
+                chunks.append(chunk)
+                if total_rows % 500000 == 0:
+                    logger.info(f"  Processed {total_rows:,} rows...")
+
+        df = pd.concat(chunks, ignore_index=True)
+        for col in list_columns or []:
+            df[col] = df[col].str.split(',')
+
+    logger.info(f"Loaded {len(df):,} of {total_rows:,} rows from {filename}")
     return df
 
 
-def load_title_basics(force_refresh: bool = False) -> pd.DataFrame:
+def load_title_basics(force_refresh: bool = False, columns: Optional[list] = None) -> pd.DataFrame:
     """
     Load IMDb title basics (metadata for all titles).
 
@@ -133,38 +375,20 @@ def load_title_basics(force_refresh: bool = False) -> pd.DataFrame:
 
     Args:
         force_refresh: If True, re-download and re-process
+        columns: Optional list of columns to load (None = all)
 
     Returns:
         DataFrame with title metadata
     """
     def fetch():
-        filepath = _download_imdb_file(IMDB_DATASETS["title_basics"])
-
-        # Read in chunks and filter for movies only to save memory
+        # Filter for movies only while reading to save memory
         logger.info("Reading and filtering for movies only...")
-        chunks = []
-        total_rows = 0
-        movie_rows = 0
-
-        for chunk in pd.read_csv(
-            filepath,
-            sep='\t',
-            na_values=['\\N'],
-            low_memory=False,
-            chunksize=100000
-        ):
-            # Filter to movies only immediately
-            chunk = chunk[chunk['titleType'] == 'movie'].copy()
-            if len(chunk) > 0:
-                chunks.append(chunk)
-                movie_rows += len(chunk)
-
-            total_rows += len(chunk)
-            if total_rows % 500000 == 0:
-                logger.info(f"  Processed {total_rows:,} rows, found {movie_rows:,} movies...")
-
-        df = pd.concat(chunks, ignore_index=True)
-        logger.info(f"Filtered to {len(df):,} movies from {total_rows:,} total titles")
+        df = _read_imdb_tsv(
+            IMDB_DATASETS["title_basics"],
+            title_type='movie',
+            string_columns=['isAdult', 'startYear', 'endYear', 'runtimeMinutes'],
+            list_columns=['genres']
+        )
 
         # Convert year to numeric (some are ranges like "2020-2023")
         df['startYear'] = pd.to_numeric(df['startYear'], errors='coerce')
@@ -173,10 +397,7 @@ def load_title_basics(force_refresh: bool = False) -> pd.DataFrame:
         df['runtimeMinutes'] = pd.to_numeric(df['runtimeMinutes'], errors='coerce')
 
         # Keep adult content flag as boolean
-        df['isAdult'] = df['isAdult'] == '1'
-
-        # Split genres into list
-        df['genres'] = df['genres'].str.split(',')
+        df['isAdult'] = pd.to_numeric(df['isAdult'], errors='coerce') == 1
 
         # Drop columns we don't need
         df = df.drop(columns=['titleType', 'originalTitle', 'endYear'], errors='ignore')
@@ -192,10 +413,10 @@ def load_title_basics(force_refresh: bool = False) -> pd.DataFrame:
 
         return df
 
-    return _load_or_fetch("title_basics", fetch, force_refresh)
+    return _load_or_fetch("title_basics", fetch, force_refresh, columns)
 
 
-def load_title_ratings(force_refresh: bool = False) -> pd.DataFrame:
+def load_title_ratings(force_refresh: bool = False, columns: Optional[list] = None) -> pd.DataFrame:
     """
     Load IMDb ratings (averageRating and numVotes).
 
@@ -203,13 +424,13 @@ def load_title_ratings(force_refresh: bool = False) -> pd.DataFrame:
 
     Args:
         force_refresh: If True, re-download and re-process
+        columns: Optional list of columns to load (None = all)
 
     Returns:
         DataFrame with ratings
     """
     def fetch():
-        filepath = _download_imdb_file(IMDB_DATASETS["title_ratings"])
-        df = _read_imdb_tsv(filepath)
+        df = _read_imdb_tsv(IMDB_DATASETS["title_ratings"])
 
         # Rename for clarity
         df = df.rename(columns={
@@ -218,12 +439,17 @@ def load_title_ratings(force_refresh: bool = False) -> pd.DataFrame:
             'numVotes': 'num_votes'
         })
 
+        # Vote counts (~3M max) fit uint32, halving the bytes scanned by
+        # filters and merges. Ratings stay float64: one-decimal values are
+        # not exact in float32.
+        df['num_votes'] = df['num_votes'].astype('uint32')
+
         return df
 
-    return _load_or_fetch("title_ratings", fetch, force_refresh)
+    return _load_or_fetch("title_ratings", fetch, force_refresh, columns)
 
 
-def load_title_crew(force_refresh: bool = False) -> pd.DataFrame:
+def load_title_crew(force_refresh: bool = False, columns: Optional[list] = None) -> pd.DataFrame:
     """
     Load IMDb crew information (directors and writers).
 
@@ -231,38 +457,40 @@ def load_title_crew(force_refresh: bool = False) -> pd.DataFrame:
 
     Args:
         force_refresh: If True, re-download and re-process
+        columns: Optional list of columns to load (None = all)
 
     Returns:
         DataFrame with crew IDs
     """
     def fetch():
-        filepath = _download_imdb_file(IMDB_DATASETS["title_crew"])
-        df = _read_imdb_tsv(filepath)
-
         # Split director/writer IDs into lists
-        df['directors'] = df['directors'].str.split(',')
-        df['writers'] = df['writers'].str.split(',')
+        df = _read_imdb_tsv(IMDB_DATASETS["title_crew"], list_columns=['directors', 'writers'])
 
         # Rename for clarity
         df = df.rename(columns={'tconst': 'imdb_id'})
 
         return df
 
-    return _load_or_fetch("title_crew", fetch, force_refresh)
+    return _load_or_fetch("title_crew", fetch, force_refresh, columns)
 
 
 def load_imdb_datasets(force_refresh: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Load both title basics and ratings.
 
+    The two datasets are independent, so they are downloaded and parsed
+    concurrently.
+
     Args:
         force_refresh: If True, re-download all datasets
 
     Returns:
         Tuple of (basics_df, ratings_df)
     """
-    basics = load_title_basics(force_refresh)
-    ratings = load_title_ratings(force_refresh)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        basics = executor.submit(load_title_basics, force_refresh)
+        ratings = executor.submit(load_title_ratings, force_refresh)
+        basics, ratings = basics.result(), ratings.result()
 
     return basics, ratings
 
@@ -287,25 +515,30 @@ def merge_master_dataset(
     """
     logger.info("Merging IMDb datasets...")
 
-    # Start with basics
-    master = basics.copy()
-
-    # Merge ratings
-    master = master.merge(ratings, on='imdb_id', how='left')
-
-    # Merge crew if provided
+    # Align ratings (and crew) to basics on the imdb_id index. Each frame is
+    # joined on its own: joining a list of frames turns bool columns (adult)
+    # into object
+    if ratings['imdb_id'].dtype != basics['imdb_id'].dtype:
+        ratings = ratings.astype({'imdb_id': basics['imdb_id'].dtype})
+    master = basics.set_index('imdb_id').join(ratings.set_index('imdb_id'), how='left')
     if crew is not None:
-        master = master.merge(crew, on='imdb_id', how='left')
+        crew = crew.astype({'imdb_id': basics['imdb_id'].dtype}).set_index('imdb_id')
+        master = master.join(crew, how='left')
+    master = master.reset_index()
 
-    # Apply vote threshold
+    # Apply vote threshold before sorting, so only surviving rows are sorted
     if min_votes > 0:
         before = len(master)
-        master = master[master['num_votes'] >= min_votes].copy()
+        master = master[master['num_votes'] >= min_votes]
         logger.info(f"Filtered to {len(master):,} movies with ≥{min_votes:,} votes (removed {before - len(master):,})")
 
     # Sort by year and votes
     master = master.sort_values(['year', 'num_votes'], ascending=[False, False])
 
+    # Genre membership as a bitmask so filters don't have to walk the lists
+    master['genre_mask'] = encode_genres(master['genres'])
+    narrow_dtypes(master)
+
     logger.info(f"Master dataset: {len(master):,} movies")
     logger.info(f"Year range: {master['year'].min():.0f} - {master['year'].max():.0f}")
     logger.info(f"Movies with ratings: {master['imdb_rating'].notna().sum():,}")
@@ -313,6 +546,163 @@ def merge_master_dataset(
     return master
 
 
+def narrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast master dataset columns to the smallest dtypes that hold them.
+
+    FLOAT32_COLUMNS become float32, and num_votes becomes int32 when it has
+    no missing values (float32 otherwise; counts stay exact below 2**24).
+    imdb_rating is kept as float64, rounded back to its one decimal in case
+    it was read from an older float32 cache.
+    STRING_COLUMNS become Arrow-backed strings when PyArrow is installed.
+
+    Args:
+        df: Master dataset
+
+    Returns:
+        The same DataFrame, modified in place
+    """
+    for col in FLOAT32_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('float32')
+
+    if 'imdb_rating' in df.columns and df['imdb_rating'].dtype != np.float64:
+        df['imdb_rating'] = df['imdb_rating'].astype('float64').round(1)
+
+    if STRING_DTYPE is not None:
+        for col in STRING_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype(STRING_DTYPE)
+
+    if 'num_votes' in df.columns:
+        df['num_votes'] = df['num_votes'].astype('int32' if df['num_votes'].notna().all() else 'float32')
+
+    return df
+
+
+def _arrow_lists(values: pd.Series):
+    """values as a PyArrow list array, or None without PyArrow or list data."""
+    if pacsv is None:
+        return None
+    try:
+        arr = pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    return arr if pa.types.is_list(arr.type) or pa.types.is_large_list(arr.type) else None
+
+
+def flatten_lists(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten a Series of lists into one array plus each item's parent position.
+
+    A flat alternative to Series.explode: with PyArrow this is its
+    list_flatten / list_parent_indices kernels (zero-copy for list[pyarrow]
+    columns), otherwise np.repeat over the list lengths. No intermediate
+    Series or index is built. Missing entries contribute no items.
+
+    Args:
+        values: Series of lists (NaN/None for none)
+
+    Returns:
+        Tuple of (object array of items, int64 positional row index of each item)
+    """
+    arr = _arrow_lists(values)
+    if arr is not None:
+        return (pc.list_flatten(arr).to_numpy(zero_copy_only=False).astype(object),
+                pc.list_parent_indices(arr).to_numpy().astype(np.int64))
+
+    lists = [v if isinstance(v, (list, tuple, np.ndarray)) else () for v in values.to_numpy(dtype=object)]
+    lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    flat = np.fromiter((item for v in lists for item in v), dtype=object, count=int(lengths.sum()))
+    return flat, np.repeat(np.arange(len(lists)), lengths)
+
+
+def encode_genres(genres: pd.Series) -> np.ndarray:
+    """
+    Encode genre lists as uint32 bitmasks (see IMDB_GENRES).
+
+    Args:
+        genres: Series of genre lists (NaN for none); list[pyarrow] columns
+            are encoded without leaving Arrow
+
+    Returns:
+        uint32 array aligned with genres; genres outside IMDB_GENRES are ignored
+    """
+    mask = np.zeros(len(genres), dtype=np.uint32)
+    arr = _arrow_lists(genres)
+    if arr is not None:
+        # Genre -> position in IMDB_GENRES with Arrow's hash lookup; unknown
+        # genres land on the trailing zero bit
+        flat = pc.list_flatten(arr).cast(pa.string())
+        positions = pc.index_in(flat, value_set=pa.array(IMDB_GENRES)).fill_null(len(IMDB_GENRES))
+        bits = _GENRE_BIT_TABLE[positions.to_numpy()]
+        parents = pc.list_parent_indices(arr).to_numpy()
+    else:
+        flat, parents = flatten_lists(genres)
+        bits = np.fromiter((GENRE_BITS.get(g, 0) for g in flat), dtype=np.uint32, count=len(flat))
+    np.bitwise_or.at(mask, parents, bits)
+    return mask
+
+
+def genre_mask(df: pd.DataFrame) -> np.ndarray:
+    """Genre bitmasks for df, from its genre_mask column if it has one"""
+    if 'genre_mask' in df.columns:
+        return df['genre_mask'].to_numpy(dtype=np.uint32)
+    return encode_genres(df['genres'])
+
+
+def has_genre(df: pd.DataFrame, *genres: str) -> np.ndarray:
+    """
+    Boolean mask of rows tagged with any of the given genres.
+
+    Args:
+        df: DataFrame with genres (and optionally genre_mask)
+        *genres: Genre names from IMDB_GENRES
+
+    Returns:
+        NumPy bool array aligned with df
+    """
+    bits = 0
+    for genre in genres:
+        bits |= GENRE_BITS[genre]
+    return (genre_mask(df) & np.uint32(bits)) != 0
+
+
+def load_master_dataset(min_votes: int = 1000, force_refresh: bool = False) -> pd.DataFrame:
+    """
+    Load the merged master dataset, cached per vote threshold.
+
+    The merged result is written to PROCESSED_DIR/master_minvotes{N}.parquet
+    and reused until either cached source table (title_basics, title_ratings)
+    is newer than it.
+
+    Args:
+        min_votes: Minimum vote threshold passed to merge_master_dataset
+        force_refresh: If True, re-download sources and rebuild the cache
+
+    Returns:
+        Master DataFrame with all movie data
+    """
+    cache_path = PROCESSED_DIR / f"master_minvotes{min_votes}.parquet"
+    sources = [PROCESSED_DIR / "title_basics.parquet", PROCESSED_DIR / "title_ratings.parquet"]
+
+    if (not force_refresh and cache_path.exists() and all(p.exists() for p in sources)
+            and cache_path.stat().st_mtime >= max(p.stat().st_mtime for p in sources)):
+        logger.info(f"Loading cached master dataset from {cache_path}")
+        master = pd.read_parquet(cache_path, engine='fastparquet')
+        if 'genre_mask' not in master.columns:  # cache predates genre_mask
+            master['genre_mask'] = encode_genres(master['genres'])
+        return narrow_dtypes(master)
+
+    basics, ratings = load_imdb_datasets(force_refresh)
+    master = merge_master_dataset(basics, ratings, min_votes=min_votes)
+
+    logger.info(f"Caching master dataset to {cache_path}")
+    master.to_parquet(cache_path, engine='fastparquet', index=False)
+
+    return master
+
+
 def validate_master_dataset(df: pd.DataFrame) -> dict:
     """
     Validate master dataset quality and return summary stats.
@@ -328,15 +718,21 @@ def validate_master_dataset(df: pd.DataFrame) -> dict:
         'with_ratings': df['imdb_rating'].notna().sum(),
         'with_runtime': df['runtime'].notna().sum(),
         'year_range': (df['year'].min(), df['year'].max()),
-        'duplicate_ids': df['imdb_id'].duplicated().sum(),
         'rating_range': (df['imdb_rating'].min(), df['imdb_rating'].max()),
         'avg_votes': df['num_votes'].mean(),
         'median_year': df['year'].median()
     }
 
-    # Check IMDb ID format
-    valid_ids = df['imdb_id'].str.match(r'^tt\d{7,8}$')
-    results['invalid_ids'] = (~valid_ids).sum()
+    # Check IMDb ID uniqueness and format (Arrow kernels over the whole column
+    # when available; missing IDs count as invalid)
+    if pacsv is not None:
+        ids = pa.array(df['imdb_id'], from_pandas=True)
+        valid = pc.sum(pc.match_substring_regex(ids, IMDB_ID_PATTERN)).as_py() or 0
+        results['duplicate_ids'] = len(ids) - pc.count_distinct(ids, mode='all').as_py()
+        results['invalid_ids'] = len(ids) - valid
+    else:
+        results['duplicate_ids'] = df['imdb_id'].duplicated().sum()
+        results['invalid_ids'] = (~df['imdb_id'].str.match(IMDB_ID_PATTERN, na=False)).sum()
 
     logger.info("Dataset validation:")
     for key, value in results.items():
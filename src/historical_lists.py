@@ -4,18 +4,34 @@ Historical movie lists parser for Wayback Machine snapshots and other sources.
 Fetches IMDb Top 250 from different years to analyze list composition changes.
 """
 
+import gzip
 import json
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from html import unescape
 from pathlib import Path
 from typing import List, Dict, Optional
 
+import numpy as np
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    from isal import igzip as gzip  # noqa: F811
+except ImportError:  # optional; faster drop-in for the stdlib gzip module
+    pass
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # optional; C parser, much faster than html.parser
+    HTML_PARSER = 'html.parser'
+
 from data_loader import CACHE_DIR, PROCESSED_DIR, logger
 
 # Wayback Machine API
@@ -28,6 +44,72 @@ IMDB_TOP250_URL = "https://www.imdb.com/chart/top"
 # Target years for historical snapshots
 SNAPSHOT_YEARS = [1996, 2000, 2005, 2010, 2015, 2020, 2024]
 
+# Wayback availability lookups, keyed by "url@timestamp". Found snapshots are
+# immutable so they never expire; misses and 404s are retried after a day.
+WAYBACK_LOOKUP_CACHE = CACHE_DIR / "wayback_lookups.json"
+NEGATIVE_CACHE_TTL = 24 * 60 * 60  # seconds
+_LOOKUP_LOCK = threading.Lock()
+
+# Years fetched from the Wayback Machine at once (kept low to stay polite)
+WAYBACK_MAX_WORKERS = 3
+
+# Processed Top 250 snapshots, one hive-style partition per year
+# (top250/snapshot_year=1996/part.0.parquet, ...)
+TOP250_DATASET_DIR = PROCESSED_DIR / "top250"
+
+# Top 250 markup: CSS selectors for the modern chart, and patterns compiled
+# once rather than per list item
+_MODERN_ITEM = 'li[class*="ipc-metadata-list-summary-item"]'
+_MODERN_TITLE = 'h3[class*="ipc-title__text"]'
+_MODERN_YEAR = 'span[class*="sc-"][class*="-year"]'
+_TITLE_HREF = 'a[href*="/title/tt"]'
+_LEGACY_TITLE_CELL = 'tr td.titleColumn'
+_RANKED_TITLE = re.compile(r'^\d+\.\s*(.+)$')
+_TT_ID = re.compile(r'/(tt\d+)/')
+_YEAR = re.compile(r'\d{4}')
+
+# Whole legacy chart row (rank, id, title, year) in one match, so that format
+# can be parsed without building a soup; the gap before the year stays in the cell
+_LEGACY_ROW = re.compile(
+    r'<td class="titleColumn">\s*(\d+)\.\s*'
+    r'<a href="[^"]*?/title/(tt\d+)/?[^"]*"[^>]*>([^<]+)</a>'
+    r'(?:(?!</td>).)*?<span class="secondaryInfo">\((\d{4})\)',
+    re.DOTALL
+)
+# Fewer legacy rows than this means the fast path missed some; parse the soup instead
+LEGACY_FAST_PATH_MIN_ROWS = 200
+
+
+def _load_lookup_cache() -> Dict[str, Dict]:
+    """Load cached Wayback availability lookups."""
+    if WAYBACK_LOOKUP_CACHE.exists():
+        return json.loads(WAYBACK_LOOKUP_CACHE.read_text(encoding='utf-8'))
+    return {}
+
+
+def _save_lookup(key: str, snapshot_url: Optional[str]):
+    """Record a Wayback availability lookup (snapshot_url None for a miss)."""
+    with _LOOKUP_LOCK:
+        cache = _load_lookup_cache()
+        cache[key] = {'snapshot_url': snapshot_url, 'checked_at': time.time()}
+        WAYBACK_LOOKUP_CACHE.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+
+
+def _is_lookup_cached(url: str, year: int, month: int = 12, day: int = 31) -> bool:
+    """Whether get_wayback_snapshot has a cached snapshot URL for this date."""
+    cached = _load_lookup_cache().get(f"{url}@{year}{month:02d}{day:02d}")
+    return cached is not None and bool(cached['snapshot_url'])
+
+
+def _is_html_cached(cache_filename: str) -> bool:
+    """Whether fetch_snapshot_html can serve cache_filename without a request."""
+    return (CACHE_DIR / (cache_filename + '.gz')).exists() or (CACHE_DIR / cache_filename).exists()
+
+
+def _is_fresh_miss(checked_at: float) -> bool:
+    """Whether a negative cache entry is still within NEGATIVE_CACHE_TTL."""
+    return time.time() - checked_at < NEGATIVE_CACHE_TTL
+
 
 def get_wayback_snapshot(url: str, year: int, month: int = 12, day: int = 31) -> Optional[str]:
     """
@@ -44,6 +126,16 @@ def get_wayback_snapshot(url: str, year: int, month: int = 12, day: int = 31) ->
     """
     target_date = f"{year}{month:02d}{day:02d}"
 
+    cache_key = f"{url}@{target_date}"
+    cached = _load_lookup_cache().get(cache_key)
+    if cached is not None:
+        if cached['snapshot_url']:
+            logger.info(f"Using cached snapshot: {cached['snapshot_url']}")
+            return cached['snapshot_url']
+        if _is_fresh_miss(cached['checked_at']):
+            logger.warning(f"No snapshot found for {url} around {year} (cached)")
+            return None
+
     params = {
         'url': url,
         'timestamp': target_date
@@ -63,9 +155,11 @@ def get_wayback_snapshot(url: str, year: int, month: int = 12, day: int = 31) ->
                 snapshot_url = snapshot['url']
                 snapshot_date = datetime.strptime(timestamp, '%Y%m%d%H%M%S').date()
                 logger.info(f"Found snapshot from {snapshot_date}: {snapshot_url}")
+                _save_lookup(cache_key, snapshot_url)
                 return snapshot_url
 
         logger.warning(f"No snapshot found for {url} around {year}")
+        _save_lookup(cache_key, None)
         return None
 
     except Exception as e:
@@ -73,10 +167,21 @@ def get_wayback_snapshot(url: str, year: int, month: int = 12, day: int = 31) ->
         return None
 
 
+def _write_html_cache(cache_path: Path, html: str):
+    """Write gzip-compressed HTML, via a temp file so a partial write never looks cached."""
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        f.write(html)
+    tmp_path.replace(cache_path)
+
+
 def fetch_snapshot_html(snapshot_url: str, cache_filename: str) -> Optional[str]:
     """
     Fetch HTML from Wayback Machine snapshot with caching.
 
+    Pages are cached gzip-compressed (<cache_filename>.gz); plain caches from
+    earlier runs are still read and recompressed on first use.
+
     Args:
         snapshot_url: Wayback Machine URL
         cache_filename: Filename for cached HTML
@@ -84,12 +189,26 @@ def fetch_snapshot_html(snapshot_url: str, cache_filename: str) -> Optional[str]
     Returns:
         HTML content as string, or None if fetch failed
     """
-    cache_path = CACHE_DIR / cache_filename
+    legacy_path = CACHE_DIR / cache_filename
+    cache_path = CACHE_DIR / (cache_filename + '.gz')
+    miss_path = legacy_path.with_name(legacy_path.name + '.404')
 
     # Check cache first
     if cache_path.exists():
         logger.info(f"Loading cached HTML from {cache_path}")
-        return cache_path.read_text(encoding='utf-8')
+        with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+            return f.read()
+
+    if legacy_path.exists():
+        logger.info(f"Loading cached HTML from {legacy_path}")
+        html = legacy_path.read_text(encoding='utf-8')
+        _write_html_cache(cache_path, html)
+        legacy_path.unlink()
+        return html
+
+    if miss_path.exists() and _is_fresh_miss(miss_path.stat().st_mtime):
+        logger.warning(f"Skipping {snapshot_url} (404 cached)")
+        return None
 
     try:
         logger.info(f"Fetching HTML from {snapshot_url}")
@@ -97,13 +216,17 @@ def fetch_snapshot_html(snapshot_url: str, cache_filename: str) -> Optional[str]
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         response = requests.get(snapshot_url, headers=headers, timeout=30)
+        if response.status_code == 404:
+            logger.error(f"Snapshot not found (404): {snapshot_url}")
+            miss_path.touch()
+            return None
         response.raise_for_status()
 
         html = response.text
 
         # Cache for future use
         logger.info(f"Caching HTML to {cache_path}")
-        cache_path.write_text(html, encoding='utf-8')
+        _write_html_cache(cache_path, html)
 
         return html
 
@@ -122,41 +245,50 @@ def parse_imdb_top250(html: str) -> List[Dict[str, str]]:
     Returns:
         List of dicts with movie info (rank, imdb_id, title, year)
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    # Fast path for the legacy table: one regex pass over the raw HTML
+    rows = _LEGACY_ROW.findall(html)
+    if len(rows) >= LEGACY_FAST_PATH_MIN_ROWS:
+        logger.info(f"Parsed {len(rows)} movies from legacy format (fast path)")
+        return [
+            {'rank': int(rank), 'imdb_id': imdb_id, 'title': unescape(title).strip(), 'year': int(year)}
+            for rank, imdb_id, title, year in rows
+        ]
+
+    soup = BeautifulSoup(html, HTML_PARSER)
     movies = []
 
     # IMDb has changed their HTML structure over the years
     # Try multiple patterns to handle different formats
 
     # Modern format (2020+): <li> tags with data-testid
-    modern_items = soup.find_all('li', {'class': re.compile(r'ipc-metadata-list-summary-item')})
+    modern_items = soup.select(_MODERN_ITEM)
     if modern_items:
         logger.info(f"Parsing modern format ({len(modern_items)} items found)")
         for idx, item in enumerate(modern_items, 1):
             try:
                 # Extract title and year
-                title_elem = item.find('h3', {'class': re.compile(r'ipc-title__text')})
+                title_elem = item.select_one(_MODERN_TITLE)
                 if title_elem:
                     title_text = title_elem.get_text(strip=True)
                     # Format: "1. The Shawshank Redemption"
-                    title_match = re.search(r'^\d+\.\s*(.+)$', title_text)
+                    title_match = _RANKED_TITLE.search(title_text)
                     title = title_match.group(1) if title_match else title_text
 
                 # Extract IMDb ID from link
-                link = item.find('a', href=re.compile(r'/title/tt\d+'))
+                link = item.select_one(_TITLE_HREF)
                 imdb_id = None
                 if link:
                     href = link['href']
-                    id_match = re.search(r'/(tt\d+)/', href)
+                    id_match = _TT_ID.search(href)
                     if id_match:
                         imdb_id = id_match.group(1)
 
                 # Extract year
-                year_elem = item.find('span', {'class': re.compile(r'sc-.*-year')})
+                year_elem = item.select_one(_MODERN_YEAR)
                 year = None
                 if year_elem:
                     year_text = year_elem.get_text(strip=True)
-                    year_match = re.search(r'\d{4}', year_text)
+                    year_match = _YEAR.search(year_text)
                     if year_match:
                         year = int(year_match.group(0))
 
@@ -174,15 +306,10 @@ def parse_imdb_top250(html: str) -> List[Dict[str, str]]:
 
     # Legacy format (1996-2019): <tr> tags in table
     if not movies:
-        legacy_items = soup.find_all('tr')
-        logger.info(f"Parsing legacy format ({len(legacy_items)} rows found)")
-        for item in legacy_items:
+        title_cells = soup.select(_LEGACY_TITLE_CELL)
+        logger.info(f"Parsing legacy format ({len(title_cells)} rows found)")
+        for title_cell in title_cells:
             try:
-                # Find title cell
-                title_cell = item.find('td', {'class': 'titleColumn'})
-                if not title_cell:
-                    continue
-
                 # Extract rank
                 rank_text = title_cell.get_text(strip=True).split('.')[0].strip()
                 rank = int(rank_text) if rank_text.isdigit() else None
@@ -194,15 +321,15 @@ def parse_imdb_top250(html: str) -> List[Dict[str, str]]:
 
                 title = link.get_text(strip=True)
                 href = link.get('href', '')
-                id_match = re.search(r'/(tt\d+)/', href)
+                id_match = _TT_ID.search(href)
                 imdb_id = id_match.group(1) if id_match else None
 
                 # Extract year
-                year_span = title_cell.find('span', {'class': 'secondaryInfo'})
+                year_span = title_cell.select_one('span.secondaryInfo')
                 year = None
                 if year_span:
                     year_text = year_span.get_text(strip=True)
-                    year_match = re.search(r'\d{4}', year_text)
+                    year_match = _YEAR.search(year_text)
                     if year_match:
                         year = int(year_match.group(0))
 
@@ -222,6 +349,36 @@ def parse_imdb_top250(html: str) -> List[Dict[str, str]]:
     return movies
 
 
+def _top250_cache_path(year: int) -> Path:
+    """Processed cache file for one year's Top 250 (its TOP250_DATASET_DIR partition)."""
+    return TOP250_DATASET_DIR / f"snapshot_year={year}" / "part.0.parquet"
+
+
+def load_top250_snapshots(years: Optional[List[int]] = None) -> Dict[int, pd.DataFrame]:
+    """
+    Load cached Top 250 snapshots from the partitioned dataset in one read.
+
+    Args:
+        years: Years to load (default: every cached year)
+
+    Returns:
+        Dictionary mapping year -> DataFrame, for the requested years that are cached
+    """
+    if not any(TOP250_DATASET_DIR.glob("snapshot_year=*/*.parquet")):
+        return {}
+
+    filters = None if years is None else [('snapshot_year', 'in', list(years))]
+    df = pd.read_parquet(TOP250_DATASET_DIR, engine='fastparquet', filters=filters)
+    if df.empty:
+        return {}
+    df['snapshot_year'] = df['snapshot_year'].astype('int64')
+
+    return {
+        int(year): group.reset_index(drop=True)
+        for year, group in df.groupby('snapshot_year', sort=True)
+    }
+
+
 def fetch_imdb_top250_snapshot(year: int, force_refresh: bool = False) -> Optional[pd.DataFrame]:
     """
     Fetch IMDb Top 250 for a specific year from Wayback Machine.
@@ -233,14 +390,12 @@ def fetch_imdb_top250_snapshot(year: int, force_refresh: bool = False) -> Option
     Returns:
         DataFrame with Top 250 movies from that year
     """
-    cache_filename = f"imdb_top250_{year}.json"
-    cache_path = PROCESSED_DIR / cache_filename
+    cache_path = _top250_cache_path(year)
 
     # Check processed cache
     if cache_path.exists() and not force_refresh:
         logger.info(f"Loading cached Top 250 from {year}")
-        df = pd.read_json(cache_path)
-        return df
+        return load_top250_snapshots([year]).get(year)
 
     # Get Wayback snapshot URL
     snapshot_url = get_wayback_snapshot(IMDB_TOP250_URL, year)
@@ -265,9 +420,10 @@ def fetch_imdb_top250_snapshot(year: int, force_refresh: bool = False) -> Option
     df = pd.DataFrame(movies)
     df['snapshot_year'] = year
 
-    # Cache processed data
+    # Cache processed data as this year's partition (the year lives in the path)
     logger.info(f"Caching processed Top 250 to {cache_path}")
-    df.to_json(cache_path, orient='records', indent=2)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    df.drop(columns='snapshot_year').to_parquet(cache_path, engine='fastparquet', index=False)
 
     logger.info(f"Fetched {len(df)} movies from Top 250 ({year})")
     return df
@@ -278,6 +434,8 @@ def fetch_all_top250_snapshots(years: Optional[List[int]] = None,
     """
     Fetch IMDb Top 250 for multiple years.
 
+    Uncached years are fetched WAYBACK_MAX_WORKERS at a time.
+
     Args:
         years: List of years to fetch (default: SNAPSHOT_YEARS)
         force_refresh: If True, re-fetch all snapshots
@@ -288,19 +446,26 @@ def fetch_all_top250_snapshots(years: Optional[List[int]] = None,
     if years is None:
         years = SNAPSHOT_YEARS
 
-    snapshots = {}
-
-    for year in years:
-        logger.info(f"\n{'='*60}")
+    def fetch(year):
         logger.info(f"Fetching Top 250 for {year}")
-        logger.info(f"{'='*60}")
-
+        cached = (_is_lookup_cached(IMDB_TOP250_URL, year)
+                  and _is_html_cached(f"imdb_top250_{year}.html"))
         df = fetch_imdb_top250_snapshot(year, force_refresh=force_refresh)
-        if df is not None:
-            snapshots[year] = df
 
-        # Be nice to Wayback Machine API
-        time.sleep(2)
+        # Be nice to Wayback Machine API (only needed if we actually called it)
+        if not cached:
+            time.sleep(2)
+        return df
+
+    # Cached years load from the dataset in one read; the rest are fetched a few at a time
+    results = {} if force_refresh else load_top250_snapshots(years)
+    to_fetch = [year for year in years if year not in results]
+
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=WAYBACK_MAX_WORKERS) as executor:
+            results.update(zip(to_fetch, executor.map(fetch, to_fetch)))
+
+    snapshots = {year: results[year] for year in years if results.get(year) is not None}
 
     logger.info(f"\nSuccessfully fetched {len(snapshots)}/{len(years)} snapshots")
     return snapshots
@@ -317,31 +482,33 @@ def analyze_list_overlap(snapshots: Dict[int, pd.DataFrame]) -> pd.DataFrame:
         DataFrame with overlap statistics
     """
     years = sorted(snapshots.keys())
-    results = []
-
-    for i, year1 in enumerate(years):
-        for year2 in years[i+1:]:
-            df1 = snapshots[year1]
-            df2 = snapshots[year2]
-
-            ids1 = set(df1['imdb_id'])
-            ids2 = set(df2['imdb_id'])
-
-            overlap = ids1 & ids2
-            only_year1 = ids1 - ids2
-            only_year2 = ids2 - ids1
-
-            results.append({
-                'year1': year1,
-                'year2': year2,
-                'year_diff': year2 - year1,
-                'overlap_count': len(overlap),
-                'overlap_pct': len(overlap) / 250 * 100,
-                'only_year1_count': len(only_year1),
-                'only_year2_count': len(only_year2)
-            })
+    if len(years) < 2:
+        return pd.DataFrame()
 
-    return pd.DataFrame(results)
+    # Film x year membership matrix; M.T @ M counts the films each pair of
+    # years shares, and its diagonal holds each list's size
+    stacked = pd.concat(
+        [snapshots[year][['imdb_id']].assign(snapshot_year=year) for year in years],
+        ignore_index=True
+    )
+    membership = pd.crosstab(stacked['imdb_id'], stacked['snapshot_year']).reindex(columns=years, fill_value=0)
+    m = (membership.to_numpy() > 0).astype(np.int64)
+    shared = m.T @ m
+    sizes = np.diag(shared)
+
+    i, j = np.triu_indices(len(years), k=1)
+    year_arr = np.array(years)
+    overlap = shared[i, j]
+
+    return pd.DataFrame({
+        'year1': year_arr[i],
+        'year2': year_arr[j],
+        'year_diff': year_arr[j] - year_arr[i],
+        'overlap_count': overlap,
+        'overlap_pct': overlap / 250 * 100,
+        'only_year1_count': sizes[i] - overlap,
+        'only_year2_count': sizes[j] - overlap
+    })
 
 
 def track_top250_volatility(
@@ -384,6 +551,7 @@ def track_top250_volatility(
 
         # Fetch and parse HTML
         html_cache = f"imdb_top250_{year}_{month:02d}.html"
+        html_cached = _is_html_cached(html_cache)
         html = fetch_snapshot_html(snapshot_url, html_cache)
         if not html:
             logger.warning(f"Could not fetch HTML for {snapshot_key}")
@@ -394,7 +562,8 @@ def track_top250_volatility(
             snapshots[snapshot_key] = pd.DataFrame(movies)
             logger.info(f"  {snapshot_key}: {len(movies)} movies")
 
-        time.sleep(1)  # Be nice to Wayback Machine
+        if not html_cached:
+            time.sleep(1)  # Be nice to Wayback Machine
 
     if not snapshots:
         logger.error("No snapshots fetched!")
@@ -8,23 +8,35 @@ Implements statistical tests to detect coordinated rating campaigns by:
 - Vote manipulation (Benford's Law violations)
 """
 
+import functools
+import hashlib
 import logging
+import os
+import pickle
+import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
 import pandas as pd
 import numpy as np
+import scipy
 from scipy import stats
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-from data_loader import PROJECT_ROOT, logger
+import data_loader
+from data_loader import CACHE_DIR, GENRE_BITS, IMDB_GENRES, PROJECT_ROOT, genre_mask, has_genre, logger
 
 # Analysis parameters
 RECENT_YEARS = (2019, 2024)
 HISTORICAL_CUTOFF = 2019
 MIN_MOVIES_PER_GENRE = 10
 BENFORD_EXPECTED = np.array([30.1, 17.6, 12.5, 9.7, 7.9, 6.7, 5.8, 5.1, 4.6])
+# Vote counts checked for suspicious clustering (sorted)
+ROUND_NUMBERS = np.array([100, 500, 1000, 5000, 10000, 50000, 100000], dtype=np.int64)
+
+# Analyzer results are memoized on disk here (see cache_analysis). Set
+# REFRESH_ANALYZER_CACHE=1 to recompute them instead of loading.
+ANALYZER_CACHE_DIR = CACHE_DIR / 'analyzers'
+REFRESH_ANALYZER_CACHE = os.environ.get('REFRESH_ANALYZER_CACHE') == '1'
 
 # Franchise definitions (manual tagging for 2019-2024)
 FRANCHISE_KEYWORDS = {
@@ -50,7 +62,158 @@ FRANCHISE_KEYWORDS = {
     'Dune': ['Dune'],
 }
 
+# Title keywords marking likely Chinese-influenced films
+CHINA_KEYWORDS = ['Dragon', 'Warrior', 'Legend', 'Dynasty', 'Crouching', 'Hidden',
+                  'Tiger', 'Kung Fu', 'Shaolin', 'Wuxia', 'Mulan', 'Emperor']
+
+
+@functools.lru_cache(maxsize=None)
+def keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Case-insensitive pattern matching any of keywords (compiled once per keyword set)"""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+def period_masks(
+    master_df: pd.DataFrame,
+    years_range: Tuple[int, int] = RECENT_YEARS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Boolean row masks for the analysis period and everything before it.
+
+    The year column is read once into a NumPy array, so both masks come from
+    a single pass and can be used with .loc / [] without index alignment.
+
+    Args:
+        master_df: Master dataset with a year column
+        years_range: (start_year, end_year) for the recent period
+
+    Returns:
+        (recent_mask, historical_mask) as NumPy bool arrays; rows with no year
+        are in neither
+    """
+    year = master_df['year'].to_numpy(dtype=float, na_value=np.nan)
+    recent_mask = (year >= years_range[0]) & (year <= years_range[1])
+    historical_mask = year < years_range[0]
+    return recent_mask, historical_mask
+
+
+def _select_rows(master_df: pd.DataFrame, mask: np.ndarray, columns: List[str]) -> pd.DataFrame:
+    """
+    Rows of master_df where mask is set, restricted to the columns an analyzer uses.
+
+    Only those columns are copied, and the result is a standalone frame that
+    derived columns can be added to without a further .copy(). Columns missing
+    from master_df (e.g. an optional genre_mask) are skipped.
+    """
+    present = [col for col in columns if col in master_df.columns]
+    return master_df[present].take(np.flatnonzero(mask))
+
+
+def _joined_genres(genres: pd.Series) -> pd.Series:
+    """Each genre list as one '|'-joined string (None where genres is missing)."""
+    return genres.map(lambda g: '|'.join(g) if isinstance(g, (list, tuple, np.ndarray)) else None)
+
+
+def _dataset_fingerprint(df: pd.DataFrame, columns: List[str]) -> str:
+    """
+    Hash the index and the given columns of df.
+
+    genres is hashed by the lists themselves (joined into strings), not by
+    its bitmask: analyzers return the lists, and different lists can share a
+    mask (e.g. genres outside IMDB_GENRES, or the same genres reordered).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for col in columns:
+        values = _joined_genres(df[col]) if col == 'genres' else df[col]
+        h.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _code_fingerprint() -> str:
+    """
+    Hash the code and settings every analyzer result depends on.
+
+    Covers this module's and data_loader's source (analyzers, their helpers
+    and constant definitions), the current values of this module's constants
+    (in case a caller changed one at runtime) and the numpy/pandas/scipy
+    versions.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for module_file in (__file__, data_loader.__file__):
+        h.update(Path(module_file).read_bytes())
+    constants = sorted((name, value) for name, value in globals().items()
+                       if name.lstrip('_').isupper() and not callable(value)
+                       and name != 'REFRESH_ANALYZER_CACHE')
+    h.update(repr(constants).encode('utf-8'))
+    h.update(f"{np.__version__}/{pd.__version__}/{scipy.__version__}".encode('utf-8'))
+    return h.hexdigest()
+
+
+def clear_analysis_cache() -> int:
+    """
+    Delete every memoized analyzer result.
+
+    Returns:
+        Number of cache files removed
+    """
+    removed = 0
+    for path in ANALYZER_CACHE_DIR.glob('*.pkl'):
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
 
+
+def cache_analysis(columns: List[str]):
+    """
+    Memoize an analyzer on disk, keyed by its arguments and input data.
+
+    The key covers the analysis code and settings (see _code_fingerprint),
+    the analyzer's default and passed non-DataFrame arguments, and a
+    fingerprint of the columns it reads. Results are reused across runs and
+    scripts until any of those change. Set REFRESH_ANALYZER_CACHE=1 to
+    recompute (and re-cache) every analyzer.
+
+    Cache files are named <analyzer>_<code fingerprint>_<key>.pkl, and
+    writing a result removes that analyzer's files from older code versions.
+
+    Args:
+        columns: Columns of master_df the analyzer depends on
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(master_df: pd.DataFrame, *args, **kwargs):
+            code = _code_fingerprint()
+            key = hashlib.blake2b(digest_size=16)
+            for part in (repr(fn.__defaults__), repr(args), repr(sorted(kwargs.items())),
+                         _dataset_fingerprint(master_df, columns)):
+                key.update(part.encode('utf-8'))
+            cache_path = ANALYZER_CACHE_DIR / f"{fn.__name__}_{code}_{key.hexdigest()}.pkl"
+
+            if cache_path.exists() and not REFRESH_ANALYZER_CACHE:
+                logger.info(f"Loading cached {fn.__name__} results from {cache_path}")
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+
+            result = fn(master_df, *args, **kwargs)
+
+            ANALYZER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(cache_path)
+
+            # Results computed by older code can never be hit again
+            for stale in ANALYZER_CACHE_DIR.glob(f"{fn.__name__}_*.pkl"):
+                if not stale.name.startswith(f"{fn.__name__}_{code}_"):
+                    stale.unlink(missing_ok=True)
+            return result
+
+        return wrapper
+    return decorator
+
+
+@cache_analysis(columns=['year', 'genres', 'imdb_rating'])
 def analyze_genre_anomalies(
     master_df: pd.DataFrame,
     years_range: Tuple[int, int] = RECENT_YEARS
@@ -67,55 +230,35 @@ def analyze_genre_anomalies(
     """
     logger.info(f"Analyzing genre anomalies for {years_range[0]}-{years_range[1]}...")
 
-    # Split into recent and historical periods
-    recent = master_df[master_df['year'].between(*years_range)].copy()
-    historical = master_df[master_df['year'] < years_range[0]].copy()
-
-    # Explode genres (movies can have multiple genres)
-    recent_exploded = recent.explode('genres')
-    historical_exploded = historical.explode('genres')
+    # Split into recent and historical periods, then into per-genre ratings
+    recent_mask, historical_mask = period_masks(master_df, years_range)
+    ratings = master_df['imdb_rating'].to_numpy()
+    masks = genre_mask(master_df)
+    recent_by_genre = _ratings_by_genre(ratings[recent_mask], masks[recent_mask])
+    hist_by_genre = _ratings_by_genre(ratings[historical_mask], masks[historical_mask])
 
-    # Compute statistics by genre
-    results = []
-    for genre in recent_exploded['genres'].dropna().unique():
-        recent_genre = recent_exploded[recent_exploded['genres'] == genre]['imdb_rating'].dropna()
-        hist_genre = historical_exploded[historical_exploded['genres'] == genre]['imdb_rating'].dropna()
+    # Summary statistics by genre (movies can have multiple genres)
+    summaries = []
+    for genre in IMDB_GENRES:
+        recent_genre = recent_by_genre[genre]
+        hist_genre = hist_by_genre[genre]
 
         if len(recent_genre) < MIN_MOVIES_PER_GENRE or len(hist_genre) < MIN_MOVIES_PER_GENRE:
             continue
 
-        # Statistics
-        recent_mean = recent_genre.mean()
-        hist_mean = hist_genre.mean()
-        diff = recent_mean - hist_mean
-
-        # T-test
-        t_stat, p_value = stats.ttest_ind(recent_genre, hist_genre, equal_var=False)
-
-        # Effect size (Cohen's d)
-        pooled_std = np.sqrt((recent_genre.std()**2 + hist_genre.std()**2) / 2)
-        cohens_d = diff / pooled_std if pooled_std > 0 else 0
-
-        results.append({
-            'genre': genre,
-            'recent_mean': recent_mean,
-            'historical_mean': hist_mean,
-            'difference': diff,
-            'recent_count': len(recent_genre),
-            'historical_count': len(hist_genre),
-            't_statistic': t_stat,
-            'p_value': p_value,
-            'cohens_d': cohens_d,
-            'effect_size_label': _effect_size_label(cohens_d),
-            'suspicious': abs(cohens_d) > 0.5 and p_value < 0.01
-        })
-
-    results_df = pd.DataFrame(results).sort_values('cohens_d', ascending=False)
+        summaries.append(_group_summary(genre, 'recent', recent_genre, 'historical', hist_genre))
+
+    # Welch t-tests and effect sizes for every genre at once
+    results_df = _compare_groups(pd.DataFrame(summaries), 'recent', 'historical')
+    results_df['effect_size_label'] = results_df['cohens_d'].map(_effect_size_label)
+    results_df['suspicious'] = (results_df['cohens_d'].abs() > 0.5) & (results_df['p_value'] < 0.01)
+    results_df = results_df.sort_values('cohens_d', ascending=False)
 
     logger.info(f"Found {results_df['suspicious'].sum()} suspicious genres with medium+ effect sizes")
     return results_df
 
 
+@cache_analysis(columns=['year', 'num_votes'])
 def detect_vote_clustering(
     master_df: pd.DataFrame,
     years_range: Tuple[int, int] = RECENT_YEARS
@@ -137,34 +280,27 @@ def detect_vote_clustering(
     """
     logger.info(f"Running Benford's Law analysis for {years_range[0]}-{years_range[1]}...")
 
-    # Filter to recent years
-    recent = master_df[master_df['year'].between(*years_range)].copy()
-
-    # Filter out NaN vote counts first
-    recent = recent[recent['num_votes'].notna()].copy()
+    # Filter to recent years with at least one vote
+    recent_mask, _ = period_masks(master_df, years_range)
+    votes = master_df['num_votes'].to_numpy(dtype=float, na_value=np.nan)
+    recent_votes = votes[recent_mask & (votes >= 1)].astype(np.int64)
 
-    # Extract first digit (exclude zeros)
-    recent['first_digit'] = recent['num_votes'].astype(str).str[0].astype(int)
-    recent = recent[recent['first_digit'] > 0]
-
-    # Benford expected vs. observed
-    observed_counts = recent['first_digit'].value_counts().sort_index()
-    observed_pct = (observed_counts / observed_counts.sum() * 100).values
-
-    # Pad to 9 digits if missing
-    observed_full = np.zeros(9)
-    observed_full[:len(observed_pct)] = observed_pct
+    # Benford expected vs. observed (one histogram over the leading digits)
+    first_digits = _leading_digits(recent_votes)
+    observed_counts = np.bincount(first_digits, minlength=10)[1:]
+    observed_full = observed_counts / observed_counts.sum() * 100
 
     # Chi-square test against Benford
     chi2, p_value = stats.chisquare(observed_full, BENFORD_EXPECTED)
 
-    # Round-number clustering
-    round_numbers = [100, 500, 1000, 5000, 10000, 50000, 100000]
-    round_counts = {num: (recent['num_votes'] == num).sum() for num in round_numbers}
-    total_round = sum(round_counts.values())
+    # Round-number clustering (one pass over the votes, then count the hits)
+    matched = recent_votes[np.isin(recent_votes, ROUND_NUMBERS)]
+    hit_counts = np.bincount(np.searchsorted(ROUND_NUMBERS, matched), minlength=len(ROUND_NUMBERS))
+    round_counts = dict(zip(ROUND_NUMBERS.tolist(), hit_counts))
+    total_round = hit_counts.sum()
 
     # Expected random clustering (should be ~0.1% of total)
-    expected_random = len(recent) * 0.001 * len(round_numbers)
+    expected_random = len(recent_votes) * 0.001 * len(ROUND_NUMBERS)
     clustering_ratio = total_round / expected_random if expected_random > 0 else 0
 
     results = {
@@ -175,7 +311,7 @@ def detect_vote_clustering(
         'round_number_counts': round_counts,
         'total_round_numbers': total_round,
         'clustering_ratio': clustering_ratio,
-        'total_movies': len(recent),
+        'total_movies': len(recent_votes),
         'manipulation_probability': 'HIGH' if p_value < 0.01 else 'MEDIUM' if p_value < 0.05 else 'LOW',
         'verdict': _benford_verdict(p_value, clustering_ratio)
     }
@@ -186,6 +322,7 @@ def detect_vote_clustering(
     return results
 
 
+@cache_analysis(columns=['year', 'title', 'genres', 'imdb_rating'])
 def detect_franchise_coordination(
     master_df: pd.DataFrame,
     franchise_map: Dict[str, List[str]] = FRANCHISE_KEYWORDS,
@@ -209,56 +346,45 @@ def detect_franchise_coordination(
     logger.info(f"Detecting franchise coordination for {years_range[0]}-{years_range[1]}...")
 
     # Filter to recent years
-    recent = master_df[master_df['year'].between(*years_range)].copy()
-
-    # Tag franchises
-    recent['franchise'] = None
-    for franchise, keywords in franchise_map.items():
-        pattern = '|'.join(keywords)
-        mask = recent['title'].str.contains(pattern, case=False, na=False, regex=True)
-        recent.loc[mask, 'franchise'] = franchise
-
-    recent['is_franchise'] = recent['franchise'].notna()
+    recent_mask, _ = period_masks(master_df, years_range)
+    recent = _select_rows(master_df, recent_mask, ['title', 'genres', 'genre_mask', 'imdb_rating'])
+
+    # Tag franchises: one scan of all titles with every franchise's keywords,
+    # then label just the hits by the keyword they matched
+    keyword_franchise = {
+        keyword.lower(): franchise
+        for franchise, keywords in franchise_map.items()
+        for keyword in keywords
+    }
+    pattern = keyword_pattern(tuple(keyword_franchise))
+    recent['is_franchise'] = recent['title'].str.contains(pattern, na=False)
 
-    # Explode genres for comparison
-    recent_exploded = recent.explode('genres')
+    hits = recent.loc[recent['is_franchise'], 'title']
+    matched = hits.str.extract(f"({pattern.pattern})", flags=re.IGNORECASE, expand=False)
+    recent['franchise'] = matched.str.lower().map(keyword_franchise)
 
     # Compare by genre
-    results = []
+    summaries = []
+    ratings = recent['imdb_rating'].to_numpy(dtype=float, na_value=np.nan)
+    rated = ~np.isnan(ratings)
+    franchise_rated = rated & recent['is_franchise'].to_numpy()
+    standalone_rated = rated & ~franchise_rated
+    masks = genre_mask(recent)
     for genre in ['Action', 'Sci-Fi', 'Adventure', 'Thriller', 'Drama']:
-        genre_data = recent_exploded[recent_exploded['genres'] == genre]
+        in_genre = (masks & np.uint32(GENRE_BITS[genre])) != 0
 
-        franchise_ratings = genre_data[genre_data['is_franchise']]['imdb_rating'].dropna()
-        standalone_ratings = genre_data[~genre_data['is_franchise']]['imdb_rating'].dropna()
+        franchise_ratings = ratings[in_genre & franchise_rated]
+        standalone_ratings = ratings[in_genre & standalone_rated]
 
         if len(franchise_ratings) < 5 or len(standalone_ratings) < 10:
             continue
 
-        franchise_mean = franchise_ratings.mean()
-        standalone_mean = standalone_ratings.mean()
-        diff = franchise_mean - standalone_mean
-
-        # T-test
-        t_stat, p_value = stats.ttest_ind(franchise_ratings, standalone_ratings, equal_var=False)
+        summaries.append(_group_summary(genre, 'franchise', franchise_ratings, 'standalone', standalone_ratings))
 
-        # Effect size
-        pooled_std = np.sqrt((franchise_ratings.std()**2 + standalone_ratings.std()**2) / 2)
-        cohens_d = diff / pooled_std if pooled_std > 0 else 0
-
-        results.append({
-            'genre': genre,
-            'franchise_mean': franchise_mean,
-            'standalone_mean': standalone_mean,
-            'difference': diff,
-            'franchise_count': len(franchise_ratings),
-            'standalone_count': len(standalone_ratings),
-            't_statistic': t_stat,
-            'p_value': p_value,
-            'cohens_d': cohens_d,
-            'suspicious': diff > 0.3 and p_value < 0.05
-        })
-
-    results_df = pd.DataFrame(results).sort_values('difference', ascending=False)
+    # Welch t-tests and effect sizes for every genre at once
+    results_df = _compare_groups(pd.DataFrame(summaries), 'franchise', 'standalone')
+    results_df['suspicious'] = (results_df['difference'] > 0.3) & (results_df['p_value'] < 0.05)
+    results_df = results_df.sort_values('difference', ascending=False)
 
     # Overall franchise summary
     franchise_films = recent[recent['is_franchise']]
@@ -269,6 +395,31 @@ def detect_franchise_coordination(
     return results_df
 
 
+def welch_ttest(mean1, var1, n1, mean2, var2, n2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Welch's t-test from summary statistics, vectorized over groups.
+
+    Equivalent to stats.ttest_ind(a, b, equal_var=False), but takes means,
+    sample variances (ddof=1) and counts, so many groups can be tested
+    against one baseline in a single call.
+
+    Args:
+        mean1, var1, n1: Summary statistics for the first sample(s)
+        mean2, var2, n2: Summary statistics for the second sample(s)
+
+    Returns:
+        (t_statistic, p_value) arrays (two-sided)
+    """
+    se1 = np.asarray(var1, dtype=float) / n1
+    se2 = np.asarray(var2, dtype=float) / n2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t_stat = (np.asarray(mean1, dtype=float) - mean2) / np.sqrt(se1 + se2)
+        dof = (se1 + se2) ** 2 / (se1 ** 2 / (np.asarray(n1) - 1) + se2 ** 2 / (np.asarray(n2) - 1))
+    p_value = 2 * stats.t.sf(np.abs(t_stat), dof)
+    return t_stat, p_value
+
+
+@cache_analysis(columns=['year', 'title', 'genres', 'runtime', 'imdb_rating', 'num_votes'])
 def identify_chinese_films_proxy(
     master_df: pd.DataFrame,
     years_range: Tuple[int, int] = RECENT_YEARS
@@ -290,24 +441,18 @@ def identify_chinese_films_proxy(
     """
     logger.info(f"Identifying Chinese film proxies for {years_range[0]}-{years_range[1]}...")
 
-    recent = master_df[master_df['year'].between(*years_range)].copy()
-
-    # Convert genres list to string for pattern matching
-    recent['genres_str'] = recent['genres'].apply(lambda x: ','.join(x) if isinstance(x, list) else '')
+    recent_mask, historical_mask = period_masks(master_df, years_range)
+    recent = _select_rows(master_df, recent_mask, ['title', 'year', 'imdb_rating', 'num_votes',
+                                                   'runtime', 'genres', 'genre_mask'])
+    historical = master_df[historical_mask]
 
     # China markers
-    china_keywords = ['Dragon', 'Warrior', 'Legend', 'Dynasty', 'Crouching', 'Hidden',
-                      'Tiger', 'Kung Fu', 'Shaolin', 'Wuxia', 'Mulan', 'Emperor']
-
     recent['china_marker_title'] = recent['title'].str.contains(
-        '|'.join(china_keywords), case=False, na=False, regex=True
+        keyword_pattern(tuple(CHINA_KEYWORDS)), na=False
     )
 
     recent['china_marker_genre'] = (
-        recent['genres_str'].str.contains('Action', case=False, na=False) &
-        (recent['genres_str'].str.contains('Drama', case=False, na=False) |
-         recent['genres_str'].str.contains('War', case=False, na=False) |
-         recent['genres_str'].str.contains('History', case=False, na=False))
+        has_genre(recent, 'Action') & has_genre(recent, 'Drama', 'War', 'History')
     )
 
     recent['china_marker_runtime'] = recent['runtime'].between(120, 140)
@@ -322,14 +467,20 @@ def identify_chinese_films_proxy(
     # Suspected Chinese films: 2+ markers
     chinese_films = recent[recent['china_score'] >= 2].copy()
 
-    # Compute expected rating (simple baseline: genre median)
-    chinese_films['expected_rating'] = chinese_films.apply(
-        lambda row: master_df[
-            (master_df['year'] < years_range[0]) &
-            (master_df['genres'].apply(lambda g: any(genre in g for genre in row['genres']) if isinstance(g, list) else False))
-        ]['imdb_rating'].median(),
-        axis=1
-    )
+    # Compute expected rating (simple baseline: median of historical films
+    # sharing any genre)
+    rated = historical[historical['imdb_rating'].notna()]
+    rated_genres = genre_mask(rated)
+    rated_ratings = rated['imdb_rating'].to_numpy(dtype=float)
+
+    def expected_rating(film_genres):
+        matches = rated_ratings[(rated_genres & film_genres) != 0]
+        return np.median(matches) if len(matches) else np.nan
+
+    # Flagged films share a handful of genre combinations; scan once per combination
+    combos, combo_idx = np.unique(genre_mask(chinese_films), return_inverse=True)
+    combo_expected = np.array([expected_rating(g) for g in combos], dtype=float)
+    chinese_films['expected_rating'] = combo_expected[combo_idx]
 
     chinese_films['rating_boost'] = chinese_films['imdb_rating'] - chinese_films['expected_rating']
 
@@ -342,6 +493,7 @@ def identify_chinese_films_proxy(
                        'num_votes', 'runtime', 'genres', 'china_score']]
 
 
+@cache_analysis(columns=['year', 'title', 'genres', 'imdb_rating', 'num_votes'])
 def analyze_documentary_manipulation(
     master_df: pd.DataFrame,
     years_range: Tuple[int, int] = RECENT_YEARS
@@ -364,19 +516,11 @@ def analyze_documentary_manipulation(
     logger.info(f"Analyzing documentary manipulation for {years_range[0]}-{years_range[1]}...")
 
     # Extract documentaries
-    master_df['is_doc'] = master_df['genres'].apply(
-        lambda g: 'Documentary' in g if isinstance(g, list) else False
-    )
-
-    recent_docs = master_df[
-        (master_df['year'].between(*years_range)) &
-        (master_df['is_doc'])
-    ].copy()
-
-    historical_docs = master_df[
-        (master_df['year'] < years_range[0]) &
-        (master_df['is_doc'])
-    ].copy()
+    recent_mask, historical_mask = period_masks(master_df, years_range)
+    is_doc = has_genre(master_df, 'Documentary')
+    doc_columns = ['title', 'year', 'imdb_rating', 'num_votes']
+    recent_docs = _select_rows(master_df, recent_mask & is_doc, doc_columns)
+    historical_docs = _select_rows(master_df, historical_mask & is_doc, doc_columns)
 
     # Vote efficiency: rating per 1000 votes
     recent_docs['vote_efficiency'] = recent_docs['imdb_rating'] / (recent_docs['num_votes'] / 1000)
@@ -395,7 +539,7 @@ def analyze_documentary_manipulation(
 
     # Identify high-efficiency outliers
     threshold = hist_efficiency + 2 * historical_docs['vote_efficiency'].std()
-    suspicious_docs = recent_docs[recent_docs['vote_efficiency'] > threshold].copy()
+    suspicious_docs = recent_docs[recent_docs['vote_efficiency'] > threshold]
     suspicious_docs = suspicious_docs.sort_values('vote_efficiency', ascending=False)
 
     results = {
@@ -422,6 +566,84 @@ def analyze_documentary_manipulation(
 
 # Helper functions
 
+_POWERS_OF_TEN = 10 ** np.arange(19, dtype=np.int64)
+_GENRE_BIT_VALUES = np.array([GENRE_BITS[genre] for genre in IMDB_GENRES], dtype=np.uint32)
+
+
+def _ratings_by_genre(ratings: np.ndarray, masks: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Non-null ratings for every genre in IMDB_GENRES.
+
+    Nulls are dropped once; each genre is then a single AND over the uint32
+    genre bitmasks rather than a DataFrame mask/.loc/dropna round trip.
+    Ratings keep their dtype and row order.
+    """
+    valid = ~pd.isna(ratings)
+    ratings, masks = ratings[valid], masks[valid]
+    return {
+        genre: ratings[(masks & bit) != 0]
+        for genre, bit in zip(IMDB_GENRES, _GENRE_BIT_VALUES)
+    }
+
+
+def _mean_std(values: np.ndarray) -> Tuple[float, float]:
+    """Mean and sample std (ddof=1) of a non-empty array, in two float64 passes."""
+    values = values.astype(np.float64, copy=False)
+    mean = values.sum() / len(values)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(np.square(values - mean).sum() / (len(values) - 1))
+    return mean, std
+
+
+def _group_summary(genre: str, name1: str, sample1: np.ndarray, name2: str, sample2: np.ndarray) -> Dict:
+    """Mean, std and count of two rating samples, keyed for _compare_groups."""
+    mean1, std1 = _mean_std(sample1)
+    mean2, std2 = _mean_std(sample2)
+    return {
+        'genre': genre,
+        f'{name1}_mean': mean1,
+        f'{name2}_mean': mean2,
+        f'{name1}_count': len(sample1),
+        f'{name2}_count': len(sample2),
+        f'{name1}_std': std1,
+        f'{name2}_std': std2,
+    }
+
+
+def _compare_groups(summary: pd.DataFrame, name1: str, name2: str) -> pd.DataFrame:
+    """
+    Difference, Welch t-test and Cohen's d for each row of _group_summary output.
+
+    All rows are tested in one vectorized welch_ttest call; the std columns
+    are consumed and dropped.
+    """
+    columns = ['genre', f'{name1}_mean', f'{name2}_mean', 'difference',
+               f'{name1}_count', f'{name2}_count', 't_statistic', 'p_value', 'cohens_d']
+    if summary.empty:
+        return pd.DataFrame(columns=columns)
+
+    std1 = summary.pop(f'{name1}_std').to_numpy(dtype=float)
+    std2 = summary.pop(f'{name2}_std').to_numpy(dtype=float)
+    diff = summary[f'{name1}_mean'] - summary[f'{name2}_mean']
+    summary.insert(3, 'difference', diff)
+
+    summary['t_statistic'], summary['p_value'] = welch_ttest(
+        summary[f'{name1}_mean'], std1 ** 2, summary[f'{name1}_count'].to_numpy(),
+        summary[f'{name2}_mean'], std2 ** 2, summary[f'{name2}_count'].to_numpy()
+    )
+
+    pooled_std = np.sqrt((std1 ** 2 + std2 ** 2) / 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        summary['cohens_d'] = np.where(pooled_std > 0, diff / pooled_std, 0)
+    return summary[columns]
+
+
+def _leading_digits(values: np.ndarray) -> np.ndarray:
+    """Leading decimal digit of each positive int64, using integer math only."""
+    magnitude = _POWERS_OF_TEN[np.searchsorted(_POWERS_OF_TEN, values, side='right') - 1]
+    return values // magnitude
+
+
 def _effect_size_label(cohens_d: float) -> str:
     """Convert Cohen's d to interpretable label."""
     abs_d = abs(cohens_d)
@@ -449,12 +671,10 @@ def _benford_verdict(p_value: float, clustering_ratio: float) -> str:
 
 if __name__ == "__main__":
     # Quick test
-    from data_loader import load_title_basics, load_title_ratings, merge_master_dataset
+    from data_loader import load_master_dataset
 
     print("Loading datasets...")
-    basics = load_title_basics()
-    ratings = load_title_ratings()
-    master = merge_master_dataset(basics, ratings, min_votes=1000)
+    master = load_master_dataset(min_votes=1000)
 
     print("\n" + "="*70)
     print("ANALYSIS 1: Genre Anomalies")
@@ -6,6 +6,9 @@ distribution and trends over time using real IMDb data.
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -13,7 +16,14 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 
-from data_loader import PROCESSED_DIR, logger
+from data_loader import PROCESSED_DIR, encode_genres, logger, narrow_dtypes
+
+# Candidate regime-change years tested by compare_all_cutoffs
+CUTOFF_YEARS = [2000, 2008, 2012, 2018, 2020]
+
+# rating_category labels, best first; 'Unknown' covers films under 1,000 votes
+RATING_CATEGORIES = ['Excellent (8.0+)', 'Good (7.0-7.9)', 'Average (6.0-6.9)',
+                     'Below Average (<6.0)', 'Unknown']
 
 
 def load_master_with_metadata() -> pd.DataFrame:
@@ -32,11 +42,17 @@ def load_master_with_metadata() -> pd.DataFrame:
         )
 
     logger.info("Loading master dataset...")
-    basics = pd.read_parquet(master_path)
-    ratings = pd.read_parquet(ratings_path)
+    basics = pd.read_parquet(master_path, engine='fastparquet')
+    ratings = pd.read_parquet(ratings_path, engine='fastparquet')
+
+    # Merge, then downcast ratings/years/votes (halves the bytes every
+    # later scan and aggregation reads)
+    master = narrow_dtypes(basics.merge(ratings, on='imdb_id', how='left'))
 
-    # Merge
-    master = basics.merge(ratings, on='imdb_id', how='left')
+    # Genre membership as a bitmask, computed once so genre filters
+    # (has_genre) are column lookups rather than walks over the lists
+    if 'genres' in master.columns:
+        master['genre_mask'] = encode_genres(master['genres'])
 
     # Add derived fields
     master['decade'] = (master['year'] // 10) * 10
@@ -47,13 +63,16 @@ def load_master_with_metadata() -> pd.DataFrame:
     )
 
     # Categorize by rating (only for movies with sufficient votes)
-    master['rating_category'] = 'Unknown'
-    mask_rated = master['num_votes'] >= 1000
-
-    master.loc[mask_rated & (master['imdb_rating'] >= 8.0), 'rating_category'] = 'Excellent (8.0+)'
-    master.loc[mask_rated & (master['imdb_rating'] >= 7.0) & (master['imdb_rating'] < 8.0), 'rating_category'] = 'Good (7.0-7.9)'
-    master.loc[mask_rated & (master['imdb_rating'] >= 6.0) & (master['imdb_rating'] < 7.0), 'rating_category'] = 'Average (6.0-6.9)'
-    master.loc[mask_rated & (master['imdb_rating'] < 6.0), 'rating_category'] = 'Below Average (<6.0)'
+    rating = master['imdb_rating'].to_numpy(dtype=float, na_value=np.nan)
+    mask_rated = master['num_votes'].to_numpy(dtype=float, na_value=np.nan) >= 1000
+
+    codes = np.select(
+        [mask_rated & (rating >= 8.0), mask_rated & (rating >= 7.0),
+         mask_rated & (rating >= 6.0), mask_rated & (rating < 6.0)],
+        [0, 1, 2, 3],
+        default=len(RATING_CATEGORIES) - 1
+    )
+    master['rating_category'] = pd.Categorical.from_codes(codes, categories=RATING_CATEGORIES)
 
     logger.info(f"Loaded {len(master):,} movies")
     logger.info(f"Movies with ratings: {master['imdb_rating'].notna().sum():,}")
@@ -75,24 +94,30 @@ def get_top_rated_by_era(master: pd.DataFrame, min_votes: int = 10000, n_top: in
     """
     logger.info(f"Finding top {n_top} movies per era (min_votes={min_votes:,})...")
 
-    results = []
-
-    for era in master['era'].cat.categories:
-        era_df = master[
-            (master['era'] == era) &
-            (master['num_votes'] >= min_votes) &
-            (master['imdb_rating'].notna())
-        ].copy()
-
-        # Sort by rating (descending), then votes (descending) as tiebreaker
-        era_df = era_df.sort_values(['imdb_rating', 'num_votes'], ascending=[False, False])
-
-        top_era = era_df.head(n_top).copy()
-        top_era['era_rank'] = range(1, len(top_era) + 1)
-
-        results.append(top_era)
+    rated = master[
+        master['era'].notna() &
+        (master['num_votes'] >= min_votes) &
+        (master['imdb_rating'].notna())
+    ]
+
+    # Only films rated at least as high as their era's n_top-th best can make
+    # its list: find that floor per era with a linear-time partition, so only
+    # the candidates are sorted
+    codes = rated['era'].cat.codes.to_numpy()
+    ratings = rated['imdb_rating'].to_numpy(dtype=float)
+    floor = np.full(len(rated['era'].cat.categories), -np.inf)
+    for code in np.unique(codes):
+        era_ratings = ratings[codes == code]
+        if len(era_ratings) > n_top:
+            floor[code] = -np.partition(-era_ratings, n_top - 1)[n_top - 1]
+    candidates = rated[ratings >= floor[codes]]
+
+    # Eras in category order; within each, rating (descending), then votes
+    # (descending) as tiebreaker
+    ranked = candidates.sort_values(['era', 'imdb_rating', 'num_votes'], ascending=[True, False, False])
+    combined = ranked.groupby('era', observed=True, sort=False).head(n_top).reset_index(drop=True)
+    combined['era_rank'] = combined.groupby('era', observed=True).cumcount() + 1
 
-    combined = pd.concat(results, ignore_index=True)
     logger.info(f"Found {len(combined):,} top-rated movies across eras")
 
     return combined
@@ -137,27 +162,19 @@ def analyze_rating_inflation(master: pd.DataFrame, min_votes: int = 1000) -> pd.
     return yearly
 
 
-def test_cutoff_hypothesis(master: pd.DataFrame, cutoff_year: int, min_votes: int = 1000) -> dict:
-    """
-    Test regime change hypothesis for a specific cutoff year.
-
-    Args:
-        master: Master dataset
-        cutoff_year: Year to test as cutoff
-        min_votes: Minimum votes threshold
-
-    Returns:
-        Dictionary with test results
-    """
-    logger.info(f"Testing cutoff hypothesis for year {cutoff_year}...")
-
-    filtered = master[
+def _cutoff_sample(master: pd.DataFrame, min_votes: int = 1000) -> pd.DataFrame:
+    """Rated 1980-2024 films with at least min_votes votes (year and rating only)."""
+    return master.loc[
         (master['num_votes'] >= min_votes) &
         (master['imdb_rating'].notna()) &
         (master['year'] >= 1980) &
-        (master['year'] <= 2024)
-    ].copy()
+        (master['year'] <= 2024),
+        ['year', 'imdb_rating']
+    ]
+
 
+def _run_cutoff_tests(filtered: pd.DataFrame, cutoff_year: int) -> dict:
+    """Before/after tests for one cutoff year on a _cutoff_sample frame."""
     # Split into before/after cutoff
     before = filtered[filtered['year'] < cutoff_year]['imdb_rating']
     after = filtered[filtered['year'] >= cutoff_year]['imdb_rating']
@@ -175,7 +192,7 @@ def test_cutoff_hypothesis(master: pd.DataFrame, cutoff_year: int, min_votes: in
     pooled_std = np.sqrt((before.std()**2 + after.std()**2) / 2)
     cohens_d = (after.mean() - before.mean()) / pooled_std
 
-    results = {
+    return {
         'cutoff_year': cutoff_year,
         'n_before': len(before),
         'n_after': len(after),
@@ -193,10 +210,32 @@ def test_cutoff_hypothesis(master: pd.DataFrame, cutoff_year: int, min_votes: in
         'cohens_d': cohens_d
     }
 
-    logger.info(f"  Before {cutoff_year}: n={len(before):,}, mean={before.mean():.3f}")
-    logger.info(f"  After {cutoff_year}: n={len(after):,}, mean={after.mean():.3f}")
-    logger.info(f"  t-test: t={t_stat:.3f}, p={t_pvalue:.4f}")
-    logger.info(f"  Cohen's d: {cohens_d:.3f}")
+
+def _log_cutoff_result(results: dict) -> None:
+    """Log the summary lines for one cutoff test."""
+    cutoff_year = results['cutoff_year']
+    logger.info(f"  Before {cutoff_year}: n={results['n_before']:,}, mean={results['mean_before']:.3f}")
+    logger.info(f"  After {cutoff_year}: n={results['n_after']:,}, mean={results['mean_after']:.3f}")
+    logger.info(f"  t-test: t={results['t_statistic']:.3f}, p={results['t_pvalue']:.4f}")
+    logger.info(f"  Cohen's d: {results['cohens_d']:.3f}")
+
+
+def test_cutoff_hypothesis(master: pd.DataFrame, cutoff_year: int, min_votes: int = 1000) -> dict:
+    """
+    Test regime change hypothesis for a specific cutoff year.
+
+    Args:
+        master: Master dataset
+        cutoff_year: Year to test as cutoff
+        min_votes: Minimum votes threshold
+
+    Returns:
+        Dictionary with test results
+    """
+    logger.info(f"Testing cutoff hypothesis for year {cutoff_year}...")
+
+    results = _run_cutoff_tests(_cutoff_sample(master, min_votes), cutoff_year)
+    _log_cutoff_result(results)
 
     return results
 
@@ -205,6 +244,9 @@ def compare_all_cutoffs(master: pd.DataFrame, min_votes: int = 1000) -> pd.DataF
     """
     Test all candidate cutoff years and compare results.
 
+    The films are filtered once; each cutoff's tests then run on a thread
+    pool (NumPy/SciPy release the GIL for the sorting and reductions).
+
     Args:
         master: Master dataset
         min_votes: Minimum votes threshold
@@ -212,13 +254,15 @@ def compare_all_cutoffs(master: pd.DataFrame, min_votes: int = 1000) -> pd.DataF
     Returns:
         DataFrame with comparison of all cutoffs
     """
-    cutoff_years = [2000, 2008, 2012, 2018, 2020]
-    results = []
+    filtered = _cutoff_sample(master, min_votes)
+    workers = min(len(CUTOFF_YEARS), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(partial(_run_cutoff_tests, filtered), CUTOFF_YEARS))
 
-    for year in cutoff_years:
+    for result in results:
         logger.info(f"\n{'='*60}")
-        result = test_cutoff_hypothesis(master, year, min_votes)
-        results.append(result)
+        logger.info(f"Testing cutoff hypothesis for year {result['cutoff_year']}...")
+        _log_cutoff_result(result)
 
     df = pd.DataFrame(results)
 
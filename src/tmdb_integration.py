@@ -11,17 +11,34 @@ Rate limit: 40 requests per 10 seconds (free tier)
 """
 
 import os
+import random
+import re
+import sqlite3
+import threading
 import time
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import json
 
+import numpy as np
 import pandas as pd
 import requests
 from dotenv import load_dotenv
 
-from data_loader import PROJECT_ROOT, PROCESSED_DIR, logger
+try:
+    import orjson
+except ImportError:  # optional; faster (de)serialization of cached responses
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:  # optional; native list columns in the metadata cache
+    pyarrow = None
+
+from data_loader import CACHE_DIR, PROJECT_ROOT, PROCESSED_DIR, STRING_DTYPE, logger
 
 # Load environment variables
 load_dotenv()
@@ -30,11 +47,80 @@ load_dotenv()
 TMDB_API_KEY = os.getenv('TMDB_API_KEY')
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 TMDB_RATE_LIMIT = 40  # requests per 10 seconds
-TMDB_BATCH_DELAY = 10  # seconds between batches
-
-# Cache directory
+TMDB_BATCH_DELAY = 10  # length of the rate-limit window in seconds
+TMDB_MAX_WORKERS = 8  # concurrent requests in batch_get_metadata
+TMDB_MAX_RETRIES = 4  # retries of a request after a 5xx or network error
+TMDB_RETRY_MAX_DELAY = 30  # cap on the backoff between retries, in seconds
+
+# /movie/{id} fields read by get_movie_metadata; the rest of the payload
+# (overview, images, collection, ...) is dropped before caching. List fields
+# map to the one key kept from each entry.
+_DETAIL_FIELDS = (
+    'id', 'title', 'release_date', 'budget', 'revenue', 'runtime',
+    'vote_average', 'vote_count', 'original_language',
+)
+_DETAIL_LIST_FIELDS = {
+    'production_companies': 'name',
+    'production_countries': 'iso_3166_1',
+    'genres': 'name',
+}
+
+# Studios that get their own studio_<name> flag column
+BIG_FIVE_STUDIOS = ['Disney', 'Warner Bros', 'Universal', 'Sony', 'Paramount']
+FLAGGED_STUDIOS = BIG_FIVE_STUDIOS + ['Netflix']
+STUDIO_COLUMNS = {
+    studio: f'studio_{studio.lower().replace(" ", "_")}' for studio in FLAGGED_STUDIOS
+}
+
+# Production company name fragments for each studio tagged in major_studios
+STUDIO_PATTERNS = {
+    'Disney': ['Disney', 'Walt Disney', 'Pixar', 'Lucasfilm', 'Marvel Studios', '20th Century'],
+    'Warner Bros': ['Warner Bros', 'Warner Brothers', 'DC Films', 'DC Entertainment', 'New Line'],
+    'Universal': ['Universal Pictures', 'Universal Studios', 'Illumination', 'DreamWorks'],
+    'Sony': ['Sony Pictures', 'Columbia Pictures', 'TriStar', 'Screen Gems'],
+    'Paramount': ['Paramount Pictures', 'Paramount Animation', 'MTV Films'],
+    'Lionsgate': ['Lionsgate', 'Summit Entertainment'],
+    'Netflix': ['Netflix'],
+    'Amazon': ['Amazon Studios', 'Amazon Prime'],
+    'Apple': ['Apple TV+', 'Apple Original Films'],
+}
+_STUDIO_PATTERNS_LOWER = {
+    studio: [pattern.lower() for pattern in patterns] for studio, patterns in STUDIO_PATTERNS.items()
+}
+# Literal alternation of each studio's lowercased fragments
+_STUDIO_REGEXES = {
+    studio: re.compile('|'.join(map(re.escape, patterns))) for studio, patterns in _STUDIO_PATTERNS_LOWER.items()
+}
+
+# Response cache: one sqlite table keyed by request (e.g. "metadata_tt0111161")
+TMDB_CACHE_DB = CACHE_DIR / 'tmdb.sqlite'
+
+# Legacy per-response JSON cache; entries are migrated into sqlite on first read
 TMDB_CACHE_DIR = PROCESSED_DIR / 'tmdb_cache'
-TMDB_CACHE_DIR.mkdir(exist_ok=True)
+
+# In-process memo of finalized per-movie metadata (cache keys with this
+# prefix), so repeat lookups in one run skip sqlite and JSON parsing
+_MEMO_PREFIX = 'metadata_'
+_METADATA_MEMO: Dict[str, Dict] = {}
+
+
+def _dumps(data: Dict) -> str:
+    """Serialize a cache payload (compact JSON; orjson when installed)."""
+    return orjson.dumps(data).decode() if orjson is not None else json.dumps(data)
+
+
+def _loads(payload: str) -> Dict:
+    """Parse a cache payload written by _dumps."""
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+def _project_details(details: Dict) -> Dict:
+    """Keep only the /movie/{id} fields that get_movie_metadata reads."""
+    projected = {key: details[key] for key in _DETAIL_FIELDS if key in details}
+    for key, field in _DETAIL_LIST_FIELDS.items():
+        if key in details:
+            projected[key] = [{field: entry.get(field)} for entry in details[key] or []]
+    return projected
 
 
 class TMDbAPIError(Exception):
@@ -47,7 +133,7 @@ class TMDbClient:
     TMDb API client with rate limiting and caching.
 
     Features:
-    - Automatic rate limiting (40 req/10sec)
+    - Automatic rate limiting (40 req/10sec, shared across threads)
     - Response caching to avoid re-fetching
     - Retry logic for transient errors
     - IMDb ID to TMDb ID conversion
@@ -68,48 +154,123 @@ class TMDbClient:
                 "Get your free API key at: https://www.themoviedb.org/settings/api"
             )
 
-        self.session = requests.Session()
-        self.session.params = {'api_key': self.api_key}
+        # One requests.Session and sqlite connection per thread
+        self._local = threading.local()
+        self._init_cache()
 
-        # Rate limiting
-        self.request_count = 0
-        self.batch_start_time = time.time()
+        # Rate limiting: send times of the requests in the current window
+        self._rate_lock = threading.Lock()
+        self._request_times = deque()
 
         logger.info("TMDb client initialized")
 
-    def _rate_limit(self):
-        """Enforce rate limit (40 requests per 10 seconds)."""
-        self.request_count += 1
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for the calling thread."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.params = {'api_key': self.api_key}
+            self._local.session = session
+        return session
 
-        if self.request_count >= TMDB_RATE_LIMIT:
-            elapsed = time.time() - self.batch_start_time
-            if elapsed < TMDB_BATCH_DELAY:
-                sleep_time = TMDB_BATCH_DELAY - elapsed
-                logger.info(f"Rate limit reached, sleeping {sleep_time:.1f}s...")
-                time.sleep(sleep_time)
+    def _rate_limit(self):
+        """Enforce rate limit (40 requests per any 10-second window)."""
+        while True:
+            with self._rate_lock:
+                now = time.monotonic()
+                while self._request_times and now - self._request_times[0] >= TMDB_BATCH_DELAY:
+                    self._request_times.popleft()
+
+                if len(self._request_times) < TMDB_RATE_LIMIT:
+                    self._request_times.append(now)
+                    return
+
+                sleep_time = TMDB_BATCH_DELAY - (now - self._request_times[0])
+
+            logger.debug(f"Rate limit reached, sleeping {sleep_time:.1f}s...")
+            time.sleep(sleep_time)
+
+    def _init_cache(self):
+        """Create the cache table if needed."""
+        with self._cache_conn:
+            self._cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS tmdb_cache ("
+                "cache_key TEXT PRIMARY KEY, payload TEXT NOT NULL, fetched_at INTEGER NOT NULL)"
+            )
 
-            # Reset counter
-            self.request_count = 0
-            self.batch_start_time = time.time()
+    @property
+    def _cache_conn(self) -> sqlite3.Connection:
+        """sqlite cache connection for the calling thread."""
+        conn = getattr(self._local, 'cache_conn', None)
+        if conn is None:
+            conn = sqlite3.connect(TMDB_CACHE_DB, timeout=30)
+            # WAL + NORMAL: readers don't block the writer and commits don't fsync
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.cache_conn = conn
+        return conn
 
     def _get_cached(self, cache_key: str) -> Optional[Dict]:
         """Load from cache if available."""
-        cache_file = TMDB_CACHE_DIR / f"{cache_key}.json"
-        if cache_file.exists():
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        memo = _METADATA_MEMO.get(cache_key)
+        if memo is not None:
+            return dict(memo)
+
+        row = self._cache_conn.execute(
+            "SELECT payload FROM tmdb_cache WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+        if row is not None:
+            data = _loads(row[0])
+            if cache_key.startswith(_MEMO_PREFIX):
+                _METADATA_MEMO[cache_key] = data
+                data = dict(data)
+            return data
+
+        legacy_file = TMDB_CACHE_DIR / f"{cache_key}.json"
+        if legacy_file.exists():
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._set_cache(cache_key, data)
+            return data
         return None
 
+    def _get_cached_many(self, cache_keys: List[str]) -> Dict[str, Dict]:
+        """Load every cached entry among cache_keys with a few IN queries."""
+        found = {key: dict(_METADATA_MEMO[key]) for key in cache_keys if key in _METADATA_MEMO}
+        remaining = [key for key in cache_keys if key not in found]
+        for i in range(0, len(remaining), 500):
+            chunk = remaining[i:i + 500]
+            rows = self._cache_conn.execute(
+                f"SELECT cache_key, payload FROM tmdb_cache WHERE cache_key IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            for key, payload in rows:
+                data = _loads(payload)
+                if key.startswith(_MEMO_PREFIX):
+                    _METADATA_MEMO[key] = data
+                    data = dict(data)
+                found[key] = data
+        return found
+
     def _set_cache(self, cache_key: str, data: Dict):
         """Save to cache."""
-        cache_file = TMDB_CACHE_DIR / f"{cache_key}.json"
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        with self._cache_conn:
+            self._cache_conn.execute(
+                "INSERT OR REPLACE INTO tmdb_cache (cache_key, payload, fetched_at) VALUES (?, ?, ?)",
+                (cache_key, _dumps(data), int(time.time()))
+            )
+        if cache_key.startswith(_MEMO_PREFIX):
+            _METADATA_MEMO[cache_key] = dict(data)
 
     def _request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """
         Make API request with error handling.
 
+        Server errors (5xx), connection errors and timeouts are retried up to
+        TMDB_MAX_RETRIES times with exponential backoff plus jitter, so a
+        transient failure doesn't abort a long batch.
+
         Args:
             endpoint: API endpoint (e.g., "/movie/550")
             params: Additional query parameters
@@ -117,29 +278,43 @@ class TMDbClient:
         Returns:
             JSON response as dictionary
         """
-        self._rate_limit()
-
         url = f"{TMDB_BASE_URL}{endpoint}"
+        attempt = 0
+
+        while True:
+            self._rate_limit()
 
-        try:
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 404:
-                logger.debug(f"TMDb 404 for {endpoint}")
-                return None
-            elif response.status_code == 429:
-                # Rate limit exceeded (shouldn't happen with our logic, but just in case)
-                logger.warning("TMDb rate limit exceeded, waiting 10s...")
-                time.sleep(10)
-                return self._request(endpoint, params)  # Retry
-            else:
-                raise TMDbAPIError(f"TMDb API error: {e}")
-
-        except requests.exceptions.RequestException as e:
-            raise TMDbAPIError(f"Network error: {e}")
+            try:
+                response = self.session.get(url, params=params, timeout=10)
+                response.raise_for_status()
+                return response.json()
+
+            except requests.exceptions.HTTPError as e:
+                if response.status_code == 404:
+                    logger.debug(f"TMDb 404 for {endpoint}")
+                    return None
+                elif response.status_code == 429:
+                    # Rate limit exceeded (shouldn't happen with our logic, but just in case)
+                    logger.warning("TMDb rate limit exceeded, waiting 10s...")
+                    time.sleep(10)
+                    continue
+                elif response.status_code < 500 or attempt >= TMDB_MAX_RETRIES:
+                    raise TMDbAPIError(f"TMDb API error: {e}")
+                error = e
+
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= TMDB_MAX_RETRIES:
+                    raise TMDbAPIError(f"Network error: {e}")
+                error = e
+
+            except requests.exceptions.RequestException as e:
+                raise TMDbAPIError(f"Network error: {e}")
+
+            # Jitter keeps the batch threads from retrying in lockstep
+            delay = min(TMDB_RETRY_MAX_DELAY, 2 ** attempt + random.random())
+            attempt += 1
+            logger.warning(f"TMDb request {endpoint} failed ({error}), retry {attempt}/{TMDB_MAX_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
 
     def find_by_imdb_id(self, imdb_id: str) -> Optional[Dict]:
         """
@@ -169,12 +344,13 @@ class TMDbClient:
 
         return None
 
-    def get_movie_details(self, tmdb_id: int) -> Optional[Dict]:
+    def get_movie_details(self, tmdb_id: Union[int, str]) -> Optional[Dict]:
         """
         Get full movie details including production companies.
 
         Args:
-            tmdb_id: TMDb movie ID
+            tmdb_id: TMDb movie ID, or an IMDb ID (e.g. "tt0111161"), which
+                the /movie endpoint resolves itself
 
         Returns:
             Movie details dictionary
@@ -190,6 +366,7 @@ class TMDbClient:
         result = self._request(endpoint)
 
         if result:
+            result = _project_details(result)
             self._set_cache(f"movie_{tmdb_id}", result)
 
         return result
@@ -211,20 +388,18 @@ class TMDbClient:
         if cached is not None:
             return cached
 
-        # Step 1: Find TMDb ID
-        find_result = self.find_by_imdb_id(imdb_id)
-        if not find_result:
+        # Step 1: Get full details in one request. /movie/{id} accepts the
+        # IMDb ID directly, so no /find round trip is needed; a TMDb ID from
+        # an earlier cached /find lookup is still used (and its cached details)
+        find_result = self._get_cached(f"find_{imdb_id}")
+        details = self.get_movie_details(find_result['id'] if find_result else imdb_id)
+        if not details:
             logger.debug(f"Movie not found in TMDb: {imdb_id}")
             return None
 
-        tmdb_id = find_result['id']
-
-        # Step 2: Get full details
-        details = self.get_movie_details(tmdb_id)
-        if not details:
-            return None
+        tmdb_id = details['id']
 
-        # Step 3: Extract relevant metadata
+        # Step 2: Extract relevant metadata
         metadata = {
             'imdb_id': imdb_id,
             'tmdb_id': tmdb_id,
@@ -261,37 +436,54 @@ class TMDbClient:
     def batch_get_metadata(
         self,
         imdb_ids: List[str],
-        show_progress: bool = True
+        show_progress: bool = True,
+        max_workers: int = TMDB_MAX_WORKERS
     ) -> pd.DataFrame:
         """
         Fetch metadata for a batch of IMDb IDs.
 
+        Requests run on a thread pool so the rate limit, not round-trip
+        latency, is what bounds throughput.
+
         Args:
             imdb_ids: List of IMDb IDs
             show_progress: Show progress logs
+            max_workers: Number of concurrent requests
 
         Returns:
-            DataFrame with metadata for all movies
+            DataFrame with metadata for all movies (in imdb_ids order)
         """
         logger.info(f"Fetching metadata for {len(imdb_ids)} movies from TMDb...")
 
-        results = []
+        # Cache hits come back from one bulk query; only misses go to the pool
+        cached = self._get_cached_many([f"metadata_{imdb_id}" for imdb_id in imdb_ids])
+        fetched = {imdb_id: cached[f"metadata_{imdb_id}"] for imdb_id in imdb_ids
+                   if f"metadata_{imdb_id}" in cached}
+        missing = [imdb_id for imdb_id in imdb_ids if imdb_id not in fetched]
+        if fetched:
+            logger.info(f"{len(fetched)} movies already cached, fetching {len(missing)}")
         errors = []
 
-        for i, imdb_id in enumerate(imdb_ids):
-            if show_progress and (i + 1) % 100 == 0:
-                logger.info(f"Progress: {i + 1}/{len(imdb_ids)} movies...")
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = {ex.submit(self.get_movie_metadata, imdb_id): imdb_id for imdb_id in missing}
 
-            try:
-                metadata = self.get_movie_metadata(imdb_id)
-                if metadata:
-                    results.append(metadata)
-                else:
+            for i, future in enumerate(as_completed(futures)):
+                if show_progress and (i + 1) % 100 == 0:
+                    logger.info(f"Progress: {i + 1}/{len(missing)} movies...")
+
+                imdb_id = futures[future]
+                try:
+                    metadata = future.result()
+                    if metadata:
+                        fetched[imdb_id] = metadata
+                    else:
+                        errors.append(imdb_id)
+
+                except Exception as e:
+                    logger.warning(f"Error fetching {imdb_id}: {e}")
                     errors.append(imdb_id)
 
-            except Exception as e:
-                logger.warning(f"Error fetching {imdb_id}: {e}")
-                errors.append(imdb_id)
+        results = [fetched[imdb_id] for imdb_id in imdb_ids if imdb_id in fetched]
 
         logger.info(f"Successfully fetched {len(results)}/{len(imdb_ids)} movies")
         if errors:
@@ -329,7 +521,7 @@ def fetch_tmdb_metadata_for_dataset(
     # Load from cache if available
     if cache_path.exists() and not force_refresh:
         logger.info(f"Loading cached TMDb metadata from {cache_path}")
-        tmdb_df = pd.read_parquet(cache_path)
+        tmdb_df = pd.read_parquet(cache_path, engine='fastparquet')
     else:
         # Fetch from TMDb API
         client = TMDbClient()
@@ -337,7 +529,14 @@ def fetch_tmdb_metadata_for_dataset(
 
         # Cache results
         logger.info(f"Caching TMDb metadata to {cache_path}")
-        tmdb_df.to_parquet(cache_path, engine='fastparquet', index=False)
+        # pyarrow writes the list columns natively; fastparquet JSON-encodes
+        # them. Either way the fastparquet read above returns them as lists
+        if pyarrow is not None:
+            tmdb_df.to_parquet(cache_path, engine='pyarrow', compression='zstd',
+                               row_group_size=50_000, index=False)
+        else:
+            tmdb_df.to_parquet(cache_path, engine='fastparquet', compression='zstd',
+                               row_group_offsets=50_000, index=False)
 
     # Merge with master dataset
     merged = master_df.merge(tmdb_df, on='imdb_id', how='left', suffixes=('', '_tmdb'))
@@ -360,29 +559,78 @@ def identify_major_studios(production_companies: List[str]) -> List[str]:
     if not production_companies or not isinstance(production_companies, list):
         return []
 
-    # Major studio patterns
-    STUDIO_PATTERNS = {
-        'Disney': ['Disney', 'Walt Disney', 'Pixar', 'Lucasfilm', 'Marvel Studios', '20th Century'],
-        'Warner Bros': ['Warner Bros', 'Warner Brothers', 'DC Films', 'DC Entertainment', 'New Line'],
-        'Universal': ['Universal Pictures', 'Universal Studios', 'Illumination', 'DreamWorks'],
-        'Sony': ['Sony Pictures', 'Columbia Pictures', 'TriStar', 'Screen Gems'],
-        'Paramount': ['Paramount Pictures', 'Paramount Animation', 'MTV Films'],
-        'Lionsgate': ['Lionsgate', 'Summit Entertainment'],
-        'Netflix': ['Netflix'],
-        'Amazon': ['Amazon Studios', 'Amazon Prime'],
-        'Apple': ['Apple TV+', 'Apple Original Films'],
-    }
-
     studios = []
     companies_str = ' '.join(production_companies).lower()
 
-    for studio, patterns in STUDIO_PATTERNS.items():
-        if any(pattern.lower() in companies_str for pattern in patterns):
+    for studio, patterns in _STUDIO_PATTERNS_LOWER.items():
+        if any(pattern in companies_str for pattern in patterns):
             studios.append(studio)
 
     return studios
 
 
+def studio_column(studio: str) -> str:
+    """Name of the boolean flag column for a studio (e.g. 'studio_warner_bros')"""
+    column = STUDIO_COLUMNS.get(studio)
+    return column if column is not None else f'studio_{studio.lower().replace(" ", "_")}'
+
+
+def summarize_studio_ratings(df: pd.DataFrame, studios: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Count films and rating mean/variance per studio flag in one vectorized pass.
+
+    Args:
+        df: DataFrame with studio_* flag columns (from add_studio_tags)
+        studios: Studios to include (default: FLAGGED_STUDIOS)
+
+    Returns:
+        DataFrame indexed by studio with count, rated (films with a rating),
+        mean_rating and var_rating (sample variance) columns
+    """
+    columns = {s: studio_column(s) for s in (studios or FLAGGED_STUDIOS)}
+    columns = {s: col for s, col in columns.items() if col in df.columns}
+    studios = list(columns)
+
+    flags = df[list(columns.values())].to_numpy(dtype=bool)
+    ratings = df['imdb_rating'].to_numpy(dtype=float)
+    rated = flags & ~np.isnan(ratings)[:, None]
+
+    # Sums of ratings and squared ratings per studio are matrix-vector products
+    filled = np.nan_to_num(ratings)
+    n_rated = rated.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_rating = (filled @ rated) / n_rated
+        var_rating = ((filled ** 2) @ rated - n_rated * mean_rating ** 2) / (n_rated - 1)
+
+    return pd.DataFrame(
+        {'count': flags.sum(axis=0), 'rated': n_rated,
+         'mean_rating': mean_rating, 'var_rating': var_rating},
+        index=pd.Index(studios, name='studio')
+    )
+
+
+def _studio_flags(production_companies: pd.Series) -> np.ndarray:
+    """
+    Studio matches for a column of production company lists.
+
+    Vectorized identify_major_studios: each list is joined and lowercased
+    once, then each studio's fragments are matched as one regex over the
+    whole column.
+
+    Returns:
+        (films x STUDIO_PATTERNS) bool array
+    """
+    # Arrow-backed strings (when available) keep the regex scans in C
+    companies_str = pd.Series(
+        [' '.join(v).lower() if isinstance(v, list) else '' for v in production_companies],
+        dtype=STRING_DTYPE or object
+    )
+    flags = np.zeros((len(companies_str), len(_STUDIO_REGEXES)), dtype=bool)
+    for j, regex in enumerate(_STUDIO_REGEXES.values()):
+        flags[:, j] = companies_str.str.contains(regex, na=False).to_numpy(dtype=bool)
+    return flags
+
+
 def add_studio_tags(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add major_studios column to DataFrame.
@@ -393,18 +641,28 @@ def add_studio_tags(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with major_studios column added
     """
-    df = df.copy()
-
-    df['major_studios'] = df['production_companies'].apply(identify_major_studios)
-    df['is_major_studio'] = df['major_studios'].apply(lambda x: len(x) > 0 if isinstance(x, list) else False)
+    # One (films x studios) bool matrix, matched column-wise; major_studios,
+    # every flag column and is_major_studio are read off it
+    studio_index = {studio: i for i, studio in enumerate(STUDIO_PATTERNS)}
+    flags = _studio_flags(df['production_companies'])
+
+    # Films share a few studio combinations: build each combination's tag
+    # list once and hand every film its own copy
+    combos, combo_idx = np.unique(flags @ (1 << np.arange(len(studio_index))), return_inverse=True)
+    studio_names = np.array(list(STUDIO_PATTERNS), dtype=object)
+    combo_tags = [studio_names[(combo >> np.arange(len(studio_index))) & 1 == 1].tolist() for combo in combos]
+    columns = {
+        'major_studios': pd.Series([combo_tags[i].copy() for i in combo_idx.ravel().tolist()],
+                                   index=df.index, dtype=object),
+        'is_major_studio': flags.any(axis=1),
+    }
 
     # Add individual studio flags
-    for studio in ['Disney', 'Warner Bros', 'Universal', 'Sony', 'Paramount', 'Netflix']:
-        df[f'studio_{studio.lower().replace(" ", "_")}'] = df['major_studios'].apply(
-            lambda x: studio in x if isinstance(x, list) else False
-        )
+    for studio, column in STUDIO_COLUMNS.items():
+        columns[column] = flags[:, studio_index[studio]]
 
-    return df
+    # One assign (which copies df) instead of a column insert per flag
+    return df.assign(**columns)
 
 
 if __name__ == "__main__":
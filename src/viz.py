@@ -5,15 +5,20 @@ Creates publication-quality figures showing rating inflation trends,
 cutoff evidence, and high-rated movie explosion.
 """
 
+import functools
+import hashlib
+import importlib.metadata
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Sequence
 
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+from matplotlib.collections import LineCollection
 
 from data_loader import PROJECT_ROOT, logger
 
@@ -21,24 +26,114 @@ from data_loader import PROJECT_ROOT, logger
 FIGURES_DIR = PROJECT_ROOT / "figures"
 FIGURES_DIR.mkdir(exist_ok=True)
 
-# Plotting style
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette('husl')
+# Formats every figure is saved in: PNG for web, PDF for publication. Set
+# VIZ_FORMATS=png to skip the slower PDF output while iterating.
+FIGURE_FORMATS = tuple(fmt.strip() for fmt in os.getenv('VIZ_FORMATS', '').split(',')
+                       if fmt.strip()) or ('png', 'pdf')
+VECTOR_FORMATS = {'pdf', 'svg', 'eps', 'ps'}
 
+# Input fingerprint of each figure's last render (see cache_figure)
+FIGURE_CACHE_DIR = FIGURES_DIR / ".cache"
 
-def save_figure(fig, filename: str, dpi: int = 300):
-    """Save figure in multiple formats."""
-    # PNG for web
-    png_path = FIGURES_DIR / f"{filename}.png"
-    fig.savefig(png_path, dpi=dpi, bbox_inches='tight')
-    logger.info(f"Saved: {png_path}")
+# master columns read by the per-film plots
+ERA_PLOT_COLUMNS = ['era', 'imdb_rating', 'num_votes']
+SCATTER_PLOT_COLUMNS = ERA_PLOT_COLUMNS + ['year']
 
-    # PDF for publication
-    pdf_path = FIGURES_DIR / f"{filename}.pdf"
-    fig.savefig(pdf_path, bbox_inches='tight')
-    logger.info(f"Saved: {pdf_path}")
+# Set once the first figure is drawn (see _configure_style)
+_STYLED = False
 
 
+def _configure_style():
+    """Apply the plotting style on first use, so importing viz stays cheap."""
+    global _STYLED
+    if _STYLED:
+        return
+    import seaborn as sns
+
+    plt.style.use('seaborn-v0_8-whitegrid')
+    sns.set_palette('husl')
+    _STYLED = True
+
+
+def save_figure(fig, filename: str, dpi: int = 300, formats: Optional[Sequence[str]] = None):
+    """Save figure in each of formats (default FIGURE_FORMATS); dpi applies to raster formats."""
+    for fmt in formats or FIGURE_FORMATS:
+        path = FIGURES_DIR / f"{filename}.{fmt}"
+        if fmt in VECTOR_FORMATS:
+            fig.savefig(path, bbox_inches='tight')
+        else:
+            fig.savefig(path, dpi=dpi, bbox_inches='tight')
+        logger.info(f"Saved: {path}")
+
+
+def _input_fingerprint(value, columns: Optional[List[str]]) -> bytes:
+    """Bytes identifying a plot input (DataFrames by column names, dtypes and content)."""
+    if isinstance(value, pd.DataFrame):
+        if columns is not None:
+            value = value[[col for col in columns if col in value.columns]]
+        layout = repr((list(value.columns), value.dtypes.astype(str).tolist()))
+        return layout.encode('utf-8') + pd.util.hash_pandas_object(value).to_numpy().tobytes()
+    return repr(value).encode('utf-8')
+
+
+def _render_fingerprint() -> bytes:
+    """Bytes identifying the rendering code: viz.py's source and the plotting library versions."""
+    versions = [f"{package}={importlib.metadata.version(package)}"
+                for package in ('matplotlib', 'seaborn', 'numpy', 'pandas', 'scipy')]
+    return Path(__file__).read_bytes() + repr(versions).encode('utf-8')
+
+
+def cache_figure(filename: str, columns: Optional[List[str]] = None):
+    """
+    Skip re-rendering a figure whose inputs are unchanged since its last render.
+
+    The key covers this module's full source (plot functions, their helpers,
+    save_figure and the style setup), the plotting library versions and a
+    fingerprint of every argument. It is kept in FIGURE_CACHE_DIR next to the
+    figures, and the plot is skipped only if the key matches and the saved
+    files still exist.
+
+    Args:
+        filename: Figure name the plot function saves under
+        columns: For DataFrame arguments, the only columns the plot reads
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = hashlib.blake2b(_render_fingerprint(), digest_size=16)
+            key.update(fn.__name__.encode('utf-8'))
+            for value in args:
+                key.update(_input_fingerprint(value, columns))
+            key.update(repr(sorted(kwargs.items())).encode('utf-8'))
+            digest = key.hexdigest()
+
+            hash_path = FIGURE_CACHE_DIR / f"{filename}.hash"
+            outputs = [FIGURES_DIR / f"{filename}.{fmt}" for fmt in FIGURE_FORMATS]
+            if (hash_path.exists() and hash_path.read_text() == digest
+                    and all(path.exists() for path in outputs)):
+                logger.info(f"Skipping {filename}: inputs unchanged since last render")
+                return
+
+            fn(*args, **kwargs)
+
+            FIGURE_CACHE_DIR.mkdir(exist_ok=True)
+            hash_path.write_text(digest)
+
+        return wrapper
+    return decorator
+
+
+def _add_cutoff_lines(ax, years: List[int]):
+    """Mark years with full-height dotted red lines, drawn as one collection."""
+    # x in data coordinates, y in axes coordinates (as axvline), without
+    # touching the data limits
+    lines = LineCollection([[(year, 0), (year, 1)] for year in years],
+                           transform=ax.get_xaxis_transform(), colors='red', linestyles=':',
+                           alpha=0.6, linewidths=1.5, zorder=2)
+    ax.add_collection(lines, autolim=False)
+
+
+@cache_figure('fig1_rating_inflation_timeline')
 def plot_rating_inflation_timeline(yearly_stats: pd.DataFrame, cutoff_years: List[int]):
     """
     Time series showing rating inflation over time with cutoff markers.
@@ -47,10 +142,11 @@ def plot_rating_inflation_timeline(yearly_stats: pd.DataFrame, cutoff_years: Lis
         yearly_stats: DataFrame with year, rating_mean, rating_std columns
         cutoff_years: List of candidate cutoff years to mark
     """
+    _configure_style()
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
 
     # Filter to 1950+
-    data = yearly_stats[yearly_stats['year'] >= 1950].copy()
+    data = yearly_stats[yearly_stats['year'] >= 1950]
 
     # Top panel: Mean rating over time
     ax1.plot(data['year'], data['rating_mean'], linewidth=2.5, color='darkblue', label='Mean Rating')
@@ -69,8 +165,7 @@ def plot_rating_inflation_timeline(yearly_stats: pd.DataFrame, cutoff_years: Lis
     ax1.axvspan(2000, 2010, alpha=0.2, color='orange', label='Inflation Era')
 
     # Mark cutoff years
-    for year in cutoff_years:
-        ax1.axvline(year, color='red', linestyle=':', alpha=0.6, linewidth=1.5)
+    _add_cutoff_lines(ax1, cutoff_years)
 
     # Highlight 2008 (strongest evidence)
     ax1.axvline(2008, color='red', linestyle='-', linewidth=2.5, label='2008 Cutoff', alpha=0.8)
@@ -87,9 +182,7 @@ def plot_rating_inflation_timeline(yearly_stats: pd.DataFrame, cutoff_years: Lis
     ax2.axvspan(2000, 2010, alpha=0.2, color='orange')
     ax2.axvline(2008, color='red', linestyle='-', linewidth=2.5, alpha=0.8)
 
-    for year in cutoff_years:
-        if year != 2008:
-            ax2.axvline(year, color='red', linestyle=':', alpha=0.6, linewidth=1.5)
+    _add_cutoff_lines(ax2, [year for year in cutoff_years if year != 2008])
 
     ax2.set_xlabel('Year', fontsize=13, fontweight='bold')
     ax2.set_ylabel('Movie Count', fontsize=13, fontweight='bold')
@@ -101,6 +194,7 @@ def plot_rating_inflation_timeline(yearly_stats: pd.DataFrame, cutoff_years: Lis
     plt.close()
 
 
+@cache_figure('fig2_era_comparison_boxplot', columns=ERA_PLOT_COLUMNS)
 def plot_era_comparison(master: pd.DataFrame):
     """
     Box plots comparing rating distributions across eras.
@@ -108,20 +202,26 @@ def plot_era_comparison(master: pd.DataFrame):
     Args:
         master: Master dataset with 'era' and 'imdb_rating' columns
     """
+    _configure_style()
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    # Filter for movies with sufficient votes
-    data = master[
-        (master['num_votes'] >= 1000) &
-        (master['imdb_rating'].notna())
-    ].copy()
+    # Filter for movies with sufficient votes: the mask is built on numpy
+    # arrays and .loc takes the rows and plotted columns in one copy
+    keep = (
+        (master['num_votes'].to_numpy(dtype=float, na_value=np.nan) >= 1000) &
+        master['imdb_rating'].notna().to_numpy()
+    )
+    data = master.loc[keep, ERA_PLOT_COLUMNS]
 
-    # Box plot by era
+    # Box plot by era; ratings are split by era code in one sort and reused
+    # for the mean labels below
     eras = data['era'].cat.categories
-    positions = range(len(eras))
+    positions = np.arange(len(eras))
+    (era_ratings,) = _split_by_codes(data['era'].cat.codes.to_numpy(), len(eras),
+                                     data['imdb_rating'].to_numpy())
 
     bp = ax.boxplot(
-        [data[data['era'] == era]['imdb_rating'] for era in eras],
+        era_ratings,
         positions=positions,
         patch_artist=True,
         widths=0.6,
@@ -132,8 +232,7 @@ def plot_era_comparison(master: pd.DataFrame):
     # Color boxes - highlight inflation era
     colors = ['lightblue', 'lightblue', 'lightblue', 'orange', 'lightcoral', 'lightcoral']
     for patch, color in zip(bp['boxes'], colors):
-        patch.set_facecolor(color)
-        patch.set_alpha(0.7)
+        patch.set(facecolor=color, alpha=0.7)
 
     ax.set_xticks(positions)
     ax.set_xticklabels(eras, fontsize=11, rotation=15, ha='right')
@@ -143,8 +242,8 @@ def plot_era_comparison(master: pd.DataFrame):
     ax.grid(alpha=0.3, axis='y')
 
     # Add mean values as text
-    for i, era in enumerate(eras):
-        mean_val = data[data['era'] == era]['imdb_rating'].mean()
+    for i, ratings in enumerate(era_ratings):
+        mean_val = ratings.mean() if len(ratings) else np.nan
         ax.text(i, mean_val + 0.15, f'{mean_val:.2f}',
                 ha='center', fontsize=10, fontweight='bold', color='darkred')
 
@@ -162,6 +261,7 @@ def plot_era_comparison(master: pd.DataFrame):
     plt.close()
 
 
+@cache_figure('fig3_cutoff_statistical_evidence')
 def plot_cutoff_evidence(cutoff_results: pd.DataFrame):
     """
     Bar chart showing statistical evidence for each cutoff year.
@@ -169,14 +269,16 @@ def plot_cutoff_evidence(cutoff_results: pd.DataFrame):
     Args:
         cutoff_results: DataFrame with cutoff test results
     """
+    _configure_style()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
     # Sort by combined rank
-    data = cutoff_results.sort_values('combined_rank').copy()
+    data = cutoff_results.sort_values('combined_rank')
 
-    # Left panel: Effect size (Cohen's d)
+    # Left panel: Effect size (Cohen's d); both panels share the year labels
     colors = ['darkred' if year == 2008 else 'steelblue' for year in data['cutoff_year']]
-    bars1 = ax1.barh(data['cutoff_year'].astype(str), data['cohens_d'].abs(),
+    year_labels = data['cutoff_year'].astype(str).to_numpy()
+    bars1 = ax1.barh(year_labels, data['cohens_d'].abs(),
                      color=colors, alpha=0.7, edgecolor='black')
 
     ax1.set_xlabel("Effect Size (|Cohen's d|)", fontsize=12, fontweight='bold')
@@ -190,8 +292,8 @@ def plot_cutoff_evidence(cutoff_results: pd.DataFrame):
         ax1.text(val + 0.003, i, label, va='center', fontsize=10, fontweight='bold')
 
     # Right panel: -log10(p-value) for significance
-    data['log_pvalue'] = -np.log10(data['t_pvalue'])
-    bars2 = ax2.barh(data['cutoff_year'].astype(str), data['log_pvalue'],
+    log_pvalue = -np.log10(data['t_pvalue'].to_numpy())
+    bars2 = ax2.barh(year_labels, log_pvalue,
                      color=colors, alpha=0.7, edgecolor='black')
 
     ax2.set_xlabel('-log10(p-value)', fontsize=12, fontweight='bold')
@@ -205,7 +307,7 @@ def plot_cutoff_evidence(cutoff_results: pd.DataFrame):
     ax2.legend(fontsize=10)
 
     # Add values on bars
-    for i, (val, year) in enumerate(zip(data['log_pvalue'], data['cutoff_year'])):
+    for i, (val, year) in enumerate(zip(log_pvalue, data['cutoff_year'])):
         label = f'{val:.0f}' + (' ★' if year == 2008 else '')
         ax2.text(val + 1, i, label, va='center', fontsize=10, fontweight='bold')
 
@@ -214,6 +316,7 @@ def plot_cutoff_evidence(cutoff_results: pd.DataFrame):
     plt.close()
 
 
+@cache_figure('fig4_high_rated_explosion')
 def plot_high_rated_explosion(decade_counts: pd.DataFrame):
     """
     Bar chart showing explosion of high-rated movies over time.
@@ -221,6 +324,7 @@ def plot_high_rated_explosion(decade_counts: pd.DataFrame):
     Args:
         decade_counts: DataFrame with decade, count, votes_median columns
     """
+    _configure_style()
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
 
     # Top panel: Count of high-rated movies by decade
@@ -270,6 +374,57 @@ def plot_high_rated_explosion(decade_counts: pd.DataFrame):
     plt.close()
 
 
+def _split_by_codes(codes: np.ndarray, n_groups: int, *arrays: np.ndarray) -> List[List[np.ndarray]]:
+    """
+    Split arrays into per-group pieces by category code with one stable sort.
+
+    Args:
+        codes: Category code of each row (negative codes are dropped)
+        n_groups: Number of categories
+        *arrays: Row-aligned arrays to split
+
+    Returns:
+        For each array, a list of n_groups pieces in the original row order
+    """
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(n_groups + 1))
+    pieces = []
+    for values in arrays:
+        values = values[order]
+        pieces.append([values[bounds[i]:bounds[i + 1]] for i in range(n_groups)])
+    return pieces
+
+
+def _grouped_linear_fit(codes: np.ndarray, x: np.ndarray, y: np.ndarray, n_groups: int):
+    """
+    Least-squares line y = intercept + slope * x for every group at once.
+
+    Args:
+        codes: Group code of each point (negative codes are ignored)
+        x, y: Point coordinates
+        n_groups: Number of groups
+
+    Returns:
+        (counts, slopes, intercepts) arrays of length n_groups; groups with
+        fewer than two distinct x values get NaN coefficients
+    """
+    valid = codes >= 0
+    codes, x, y = codes[valid], x[valid], y[valid]
+
+    counts = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = np.bincount(codes, weights=x, minlength=n_groups) / counts
+        y_mean = np.bincount(codes, weights=y, minlength=n_groups) / counts
+        # Centered sums (rather than raw sums of squares) keep the fit stable
+        dx = x - x_mean[codes]
+        sxx = np.bincount(codes, weights=dx * dx, minlength=n_groups)
+        sxy = np.bincount(codes, weights=dx * (y - y_mean[codes]), minlength=n_groups)
+        slopes = np.where(sxx > 0, sxy / sxx, np.nan)
+    intercepts = y_mean - slopes * x_mean
+    return counts, slopes, intercepts
+
+
+@cache_figure('fig5_rating_vs_votes_scatter', columns=SCATTER_PLOT_COLUMNS)
 def plot_rating_vs_votes_scatter(master: pd.DataFrame):
     """
     Scatter plot showing relationship between rating and vote count by era.
@@ -277,14 +432,16 @@ def plot_rating_vs_votes_scatter(master: pd.DataFrame):
     Args:
         master: Master dataset
     """
+    _configure_style()
     fig, ax = plt.subplots(figsize=(12, 8))
 
-    # Filter for movies with sufficient data
-    data = master[
-        (master['num_votes'] >= 1000) &
-        (master['imdb_rating'].notna()) &
-        (master['year'] >= 1980)
-    ].copy()
+    # Filter for movies with sufficient data, taking only the plotted columns
+    keep = (
+        (master['num_votes'].to_numpy(dtype=float, na_value=np.nan) >= 1000) &
+        master['imdb_rating'].notna().to_numpy() &
+        (master['year'].to_numpy(dtype=float, na_value=np.nan) >= 1980)
+    )
+    data = master.loc[keep, SCATTER_PLOT_COLUMNS]
 
     # Sample for visualization (too many points otherwise)
     if len(data) > 10000:
@@ -298,19 +455,27 @@ def plot_rating_vs_votes_scatter(master: pd.DataFrame):
         '2020+': 'purple'
     }
 
-    for era, color in era_colors.items():
-        era_data = data[data['era'] == era]
-        ax.scatter(np.log10(era_data['num_votes']), era_data['imdb_rating'],
+    # log10(votes) is taken once over the sample and split by era code for
+    # the scatter; the regression fit below reuses the same arrays
+    eras = data['era'].cat.categories
+    codes = data['era'].cat.codes.to_numpy()
+    era_codes = eras.get_indexer(list(era_colors))
+    log_votes = np.log10(data['num_votes'].to_numpy(dtype=float))
+    ratings = data['imdb_rating'].to_numpy(dtype=float)
+    era_log_votes, era_ratings = _split_by_codes(codes, len(eras), log_votes, ratings)
+
+    for (era, color), code in zip(era_colors.items(), era_codes):
+        x, y = (era_log_votes[code], era_ratings[code]) if code >= 0 else ([], [])
+        ax.scatter(x, y,
                   alpha=0.4, s=20, c=color, label=era, edgecolors='none')
 
-    # Add regression lines for each era
-    for era, color in era_colors.items():
-        era_data = data[data['era'] == era]
-        if len(era_data) > 10:
-            z = np.polyfit(np.log10(era_data['num_votes']), era_data['imdb_rating'], 1)
-            p = np.poly1d(z)
-            x_range = np.linspace(3, 6.5, 100)
-            ax.plot(x_range, p(x_range), color=color, linewidth=2.5, alpha=0.8, linestyle='--')
+    # Add regression lines for each era, all fitted at once from grouped sums
+    counts, slopes, intercepts = _grouped_linear_fit(codes, log_votes, ratings, len(eras))
+    x_range = np.linspace(3, 6.5, 100)
+    for (era, color), code in zip(era_colors.items(), era_codes):
+        if code >= 0 and counts[code] > 10:
+            ax.plot(x_range, intercepts[code] + slopes[code] * x_range,
+                    color=color, linewidth=2.5, alpha=0.8, linestyle='--')
 
     ax.set_xlabel('log10(Number of Votes)', fontsize=12, fontweight='bold')
     ax.set_ylabel('IMDb Rating', fontsize=12, fontweight='bold')
@@ -327,6 +492,7 @@ def plot_rating_vs_votes_scatter(master: pd.DataFrame):
     plt.close()
 
 
+@cache_figure('fig6_decade_summary')
 def plot_summary_heatmap(yearly_stats: pd.DataFrame):
     """
     Heatmap showing rating trends over decades and vote categories.
@@ -334,14 +500,15 @@ def plot_summary_heatmap(yearly_stats: pd.DataFrame):
     Args:
         yearly_stats: DataFrame with year and rating_mean
     """
+    _configure_style()
     # This is a simplified version - could be enhanced with more granular data
     fig, ax = plt.subplots(figsize=(10, 6))
 
     # Group by decade
-    data = yearly_stats[yearly_stats['year'] >= 1950].copy()
-    data['decade'] = (data['year'] // 10) * 10
+    data = yearly_stats[yearly_stats['year'] >= 1950]
+    decade = ((data['year'] // 10) * 10).rename('decade')
 
-    decade_summary = data.groupby('decade').agg({
+    decade_summary = data.groupby(decade).agg({
         'rating_mean': 'mean',
         'rating_std': 'mean',
         'movie_count': 'sum'
@@ -377,6 +544,11 @@ def plot_summary_heatmap(yearly_stats: pd.DataFrame):
     plt.close()
 
 
+def _init_render_worker():
+    """Use the non-interactive Agg backend in figure worker processes."""
+    matplotlib.use('Agg')
+
+
 def generate_all_figures(master: pd.DataFrame, yearly_stats: pd.DataFrame,
                         cutoff_results: pd.DataFrame, decade_counts: pd.DataFrame):
     """
@@ -393,31 +565,42 @@ def generate_all_figures(master: pd.DataFrame, yearly_stats: pd.DataFrame,
 
     cutoff_years = [2000, 2008, 2012, 2018, 2020]
 
-    logger.info("\n[1/6] Generating rating inflation timeline...")
-    plot_rating_inflation_timeline(yearly_stats, cutoff_years)
+    # Both per-film plots read from one narrow projection of master
+    master = master[SCATTER_PLOT_COLUMNS]
 
-    logger.info("[2/6] Generating era comparison box plots...")
-    plot_era_comparison(master)
-
-    logger.info("[3/6] Generating cutoff evidence charts...")
-    plot_cutoff_evidence(cutoff_results)
-
-    logger.info("[4/6] Generating high-rated movie explosion...")
-    plot_high_rated_explosion(decade_counts)
-
-    logger.info("[5/6] Generating rating vs votes scatter...")
-    plot_rating_vs_votes_scatter(master)
+    jobs = [
+        ("rating inflation timeline", plot_rating_inflation_timeline, (yearly_stats, cutoff_years)),
+        ("era comparison box plots", plot_era_comparison, (master,)),
+        ("cutoff evidence charts", plot_cutoff_evidence, (cutoff_results,)),
+        ("high-rated movie explosion", plot_high_rated_explosion, (decade_counts,)),
+        ("rating vs votes scatter", plot_rating_vs_votes_scatter, (master,)),
+        ("decade summary", plot_summary_heatmap, (yearly_stats,)),
+    ]
 
-    logger.info("[6/6] Generating decade summary...")
-    plot_summary_heatmap(yearly_stats)
+    # The figures are independent: render them in worker processes (pyplot
+    # is not thread-safe), or in order here when there is only one CPU
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as pool:
+            futures = []
+            for i, (label, plot, args) in enumerate(jobs, 1):
+                logger.info(f"[{i}/{len(jobs)}] Generating {label}...")
+                futures.append(pool.submit(plot, *args))
+            for future in futures:
+                future.result()
+    else:
+        for i, (label, plot, args) in enumerate(jobs, 1):
+            logger.info(f"[{i}/{len(jobs)}] Generating {label}...")
+            plot(*args)
 
     logger.info(f"\n✓ All figures saved to {FIGURES_DIR}/")
-    logger.info("  - fig1_rating_inflation_timeline.png/pdf")
-    logger.info("  - fig2_era_comparison_boxplot.png/pdf")
-    logger.info("  - fig3_cutoff_statistical_evidence.png/pdf")
-    logger.info("  - fig4_high_rated_explosion.png/pdf")
-    logger.info("  - fig5_rating_vs_votes_scatter.png/pdf")
-    logger.info("  - fig6_decade_summary.png/pdf")
+    formats = '/'.join(FIGURE_FORMATS)
+    logger.info(f"  - fig1_rating_inflation_timeline.{formats}")
+    logger.info(f"  - fig2_era_comparison_boxplot.{formats}")
+    logger.info(f"  - fig3_cutoff_statistical_evidence.{formats}")
+    logger.info(f"  - fig4_high_rated_explosion.{formats}")
+    logger.info(f"  - fig5_rating_vs_votes_scatter.{formats}")
+    logger.info(f"  - fig6_decade_summary.{formats}")
 
 
 def plot_genre_anomalies(genre_results: pd.DataFrame, years_range: tuple = (2019, 2024)):
@@ -428,6 +611,7 @@ def plot_genre_anomalies(genre_results: pd.DataFrame, years_range: tuple = (2019
         genre_results: DataFrame from analyze_genre_anomalies()
         years_range: (start_year, end_year) for recent period
     """
+    _configure_style()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
 
     # Sort by difference (most inflated first)
@@ -489,6 +673,7 @@ def plot_benford_violations(benford_results: dict):
     Args:
         benford_results: Dictionary from detect_vote_clustering()
     """
+    _configure_style()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
 
     # Left panel: Benford's Law comparison
@@ -552,6 +737,7 @@ def plot_franchise_coordination(franchise_results: pd.DataFrame):
     Args:
         franchise_results: DataFrame from detect_franchise_coordination()
     """
+    _configure_style()
     fig, ax = plt.subplots(figsize=(12, 8))
 
     data = franchise_results.sort_values('difference', ascending=True)
@@ -601,6 +787,7 @@ def plot_documentary_manipulation(doc_results: dict):
     Args:
         doc_results: Dictionary from analyze_documentary_manipulation()
     """
+    _configure_style()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
 
     # Left panel: Rating comparison
@@ -671,6 +858,7 @@ def plot_manipulation_summary(
         franchise_results: Franchise coordination results
         doc_results: Documentary manipulation results
     """
+    _configure_style()
     fig = plt.figure(figsize=(16, 12))
     gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
 